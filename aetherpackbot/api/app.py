@@ -2,18 +2,200 @@
 
 from __future__ import annotations
 
+import mimetypes
+import os
+import stat
+from collections import OrderedDict
+from email.utils import formatdate, parsedate
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+import anyio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Receive, Scope, Send
+
+from aetherpackbot.api.responses import OrjsonResponse
+from aetherpackbot.api.routes import chat, config, health, platforms, plugins, providers
 
 if TYPE_CHECKING:
     from aetherpackbot.core.engine import BotEngine
 
 
+_CORS_METHODS = ("GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH")
+
+
+class StaticFile(NamedTuple):
+    """A static file's path and the response headers derived from its stat."""
+
+    path: str
+    size: int
+    etag: str
+    last_modified: str
+
+
+def _stat_static_file(path: Path) -> StaticFile:
+    """Stat a static file and build its cached entry. Blocking."""
+    st = path.stat()
+    return StaticFile(
+        str(path),
+        st.st_size,
+        f'"{st.st_mtime_ns:x}-{st.st_size:x}"',
+        formatdate(st.st_mtime, usegmt=True),
+    )
+
+
+def _not_modified(file: StaticFile, request_headers: Headers) -> bool:
+    """Whether a conditional request can be answered with 304 Not Modified."""
+    if if_none_match := request_headers.get("if-none-match"):
+        if if_none_match.strip() == "*":
+            return True
+        return file.etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    since = parsedate(if_modified_since)
+    return since is not None and since >= parsedate(file.last_modified)
+
+
+class StaticFileRef:
+    """A static file stat'ed once, off the event loop, and re-checked only after a failed send.
+
+    The admin panel ships inside the package and doesn't change while the
+    server runs, so per-request stats would only cost a syscall each time.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file: StaticFile | None = None
+
+    async def get(self) -> StaticFile:
+        """Return the file's entry, stat'ing it on first use."""
+        if self._file is None:
+            self._file = await anyio.to_thread.run_sync(_stat_static_file, self.path)
+        return self._file
+
+    def invalidate(self) -> None:
+        """Forget the entry so the next request stats the file again."""
+        self._file = None
+
+
+class PathSendResponse(Response):
+    """File response using the ASGI ``http.response.pathsend`` extension.
+
+    Servers advertising the extension send the file straight from the page
+    cache to the socket; others fall back to a regular ``FileResponse``.
+    HEAD and conditional requests are answered from the cached entry
+    without sending the file.
+    """
+
+    def __init__(self, file: StaticFileRef, media_type: str = "text/html") -> None:
+        super().__init__(media_type=media_type)
+        self.file = file
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        file = await self.file.get()
+        headers = {
+            "content-type": f"{self.media_type}; charset=utf-8",
+            "content-length": str(file.size),
+            "etag": file.etag,
+            "last-modified": file.last_modified,
+        }
+        if _not_modified(file, Headers(scope=scope)):
+            await NotModifiedResponse(Headers(headers))(scope, receive, send)
+            return
+
+        if "http.response.pathsend" not in scope.get("extensions", {}):
+            response = FileResponse(
+                file.path,
+                headers={"etag": file.etag, "last-modified": file.last_modified},
+                media_type=self.media_type,
+            )
+            await response(scope, receive, send)
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+            }
+        )
+        if scope["method"] == "HEAD":
+            await send({"type": "http.response.body", "body": b""})
+            return
+        try:
+            await send({"type": "http.response.pathsend", "path": file.path})
+        except OSError:
+            # The file moved or changed under us; stat it again next time
+            self.file.invalidate()
+            raise
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with an in-memory LRU for small assets.
+
+    Cached entries are validated against the file's mtime and size on every
+    hit, so edits on disk are picked up without a restart. Files above
+    ``max_file_size`` are served by the parent class as usual.
+    """
+
+    max_entries = 100
+    max_file_size = 1024 * 1024
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # request path -> (full path, mtime_ns, size, body, headers)
+        self._cache: OrderedDict[str, tuple[str, int, int, bytes, dict[str, str]]] = OrderedDict()
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        entry = self._cache.get(path)
+        if entry is not None:
+            full_path, mtime_ns, size, body, headers = entry
+            try:
+                st = os.stat(full_path)
+            except OSError:
+                st = None
+            if st is not None and st.st_mtime_ns == mtime_ns and st.st_size == size:
+                self._cache.move_to_end(path)
+                return self._cached_response(body, headers, scope)
+            del self._cache[path]
+
+        full_path, st = await anyio.to_thread.run_sync(self.lookup_path, path)
+        if st is None or not stat.S_ISREG(st.st_mode) or st.st_size > self.max_file_size:
+            return await super().get_response(path, scope)
+
+        body = await anyio.to_thread.run_sync(Path(full_path).read_bytes)
+        media_type = mimetypes.guess_type(full_path)[0] or "text/plain"
+        if media_type.startswith("text/"):
+            media_type += "; charset=utf-8"
+        headers = {
+            "content-type": media_type,
+            "etag": f'"{st.st_mtime_ns:x}-{len(body):x}"',
+            "last-modified": formatdate(st.st_mtime, usegmt=True),
+        }
+
+        self._cache[path] = (full_path, st.st_mtime_ns, len(body), body, headers)
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+        return self._cached_response(body, headers, scope)
+
+    def _cached_response(self, body: bytes, headers: dict[str, str], scope: Scope) -> Response:
+        """Build a response for a cached asset, honouring conditional requests."""
+        response = Response(content=body, headers=headers)
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
 def create_app(engine: BotEngine | None = None) -> FastAPI:
     """Create and configure FastAPI application."""
     app = FastAPI(
@@ -22,23 +204,31 @@ def create_app(engine: BotEngine | None = None) -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=OrjsonResponse,
     )
 
-    # CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # CORS middleware; an empty origin list (same-origin deployments) skips it entirely
+    cors_origins = engine.settings.api.cors_origins if engine else ["*"]
+    if cors_origins:
+        if "*" in cors_origins:
+            origin_kwargs: dict[str, Any] = {"allow_origin_regex": r".*"}
+        else:
+            origin_kwargs = {"allow_origins": cors_origins}
+        app.add_middleware(
+            CORSMiddleware,
+            allow_credentials=True,
+            allow_methods=_CORS_METHODS,
+            allow_headers=("*",),
+            max_age=600,
+            **origin_kwargs,
+        )
 
-    # Store engine in app state
+    # Store engine in app state, along with the engine's live provider dict for
+    # per-request lookups by name
     app.state.engine = engine
+    app.state.providers_by_name = engine._providers if engine else {}
 
     # Register routes
-    from aetherpackbot.api.routes import chat, config, health, platforms, plugins, providers
-
     app.include_router(health.router, tags=["Health"])
     app.include_router(plugins.router, prefix="/api/plugins", tags=["Plugins"])
     app.include_router(platforms.router, prefix="/api/platforms", tags=["Platforms"])
@@ -49,11 +239,13 @@ def create_app(engine: BotEngine | None = None) -> FastAPI:
     # Static files for admin panel
     static_dir = Path(__file__).parent / "static"
     if static_dir.exists():
-        app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+        app.mount("/static", CachedStaticFiles(directory=str(static_dir)), name="static")
+
+        index = StaticFileRef(static_dir / "index.html")
 
-        @app.get("/", include_in_schema=False)
-        async def serve_admin_panel():
+        @app.api_route("/", methods=["GET", "HEAD"], include_in_schema=False)
+        async def serve_admin_panel() -> PathSendResponse:
             """Serve the admin panel."""
-            return FileResponse(static_dir / "index.html")
+            return PathSendResponse(index)
 
     return app
@@ -0,0 +1,19 @@
+"""Per-app caches for rendered API responses."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+from starlette.datastructures import State
+
+
+def cached_json(state: State, name: str, key: Hashable, build: Callable[[], Any]) -> Response:
+    """Return the JSON body cached under ``name``, rebuilding it when ``key`` changes."""
+    entry = getattr(state, name, None)
+    if entry is None or entry[0] != key:
+        entry = (key, orjson.dumps(build()))
+        setattr(state, name, entry)
+    return Response(content=entry[1], media_type="application/json")
@@ -0,0 +1,19 @@
+"""Response classes shared by the API routes."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Stands in for FastAPI's ``ORJSONResponse``, which is deprecated and warns
+    on every response.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
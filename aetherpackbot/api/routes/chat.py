@@ -1,13 +1,55 @@
 """Chat API routes."""
 
+import re
+from collections.abc import AsyncIterator
+
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+
+from aetherpackbot.providers.base import ChatMessage, ChatRole, system_message
 
-from aetherpackbot.providers.base import ChatMessage, ChatRole
+try:
+    from sse_starlette.sse import EventSourceResponse, ServerSentEvent
+except ImportError:  # sse-starlette is optional
+    EventSourceResponse = None  # type: ignore[assignment,misc]
 
 router = APIRouter()
 
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+_SSE_PING_SECONDS = 15
+_LINE_SEP = re.compile(r"\r\n|\r|\n")
+
+
+def _encode_event(event: str, data: str) -> bytes:
+    """Encode an SSE frame the same way sse-starlette does."""
+    lines = "".join(f"data: {line}\r\n" for line in _LINE_SEP.split(data))
+    return f"event: {event}\r\n{lines}\r\n".encode()
+
+
+def _sse_response(events: AsyncIterator[tuple[str, str]]) -> Response:
+    """Wrap ``(event, data)`` pairs in an SSE response.
+
+    Uses sse-starlette when installed, which also sends keep-alive pings so
+    proxies don't drop long generations; otherwise falls back to a plain
+    ``StreamingResponse`` with identical framing.
+    """
+    if EventSourceResponse is not None:
+        return EventSourceResponse(
+            (ServerSentEvent(data=data, event=event) async for event, data in events),
+            ping=_SSE_PING_SECONDS,
+            headers=_SSE_HEADERS,
+        )
+    return StreamingResponse(
+        (_encode_event(event, data) async for event, data in events),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
+
 
 class ChatRequest(BaseModel):
     """Chat completion request."""
@@ -24,34 +66,39 @@ class ChatRequest(BaseModel):
 class ChatResponse(BaseModel):
     """Chat completion response."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     content: str
     model: str
     provider: str
     usage: dict[str, int] | None = None
 
 
+def _build_messages(body: ChatRequest) -> list[ChatMessage]:
+    """Build the conversation sent to the provider."""
+    user_message = ChatMessage(role=ChatRole.USER, content=body.message)
+    if body.system_prompt:
+        return [system_message(body.system_prompt), user_message]
+    return [user_message]
+
+
 @router.post("")
 async def chat(request: Request, body: ChatRequest) -> ChatResponse:
     """Send a chat completion request."""
-    engine = request.app.state.engine
-    if not engine:
+    state = request.app.state
+    if not state.engine:
         raise HTTPException(status_code=503, detail="Engine not initialized")
 
     # Get provider
-    provider_name = body.provider
-    if provider_name:
-        provider = engine.get_provider(provider_name)
+    if body.provider:
+        provider = state.providers_by_name.get(body.provider)
     else:
-        provider = engine.get_default_provider()
+        provider = state.engine.get_default_provider()
 
     if not provider:
         raise HTTPException(status_code=404, detail="No LLM provider available")
 
-    # Build messages
-    messages: list[ChatMessage] = []
-    if body.system_prompt:
-        messages.append(ChatMessage(role=ChatRole.SYSTEM, content=body.system_prompt))
-    messages.append(ChatMessage(role=ChatRole.USER, content=body.message))
+    messages = _build_messages(body)
 
     # Build kwargs
     kwargs: dict = {}
@@ -75,31 +122,24 @@ async def chat(request: Request, body: ChatRequest) -> ChatResponse:
 
 
 @router.post("/stream")
-async def chat_stream(request: Request, body: ChatRequest) -> StreamingResponse:
+async def chat_stream(request: Request, body: ChatRequest) -> Response:
     """Stream a chat completion response."""
-    engine = request.app.state.engine
-    if not engine:
+    state = request.app.state
+    if not state.engine:
         raise HTTPException(status_code=503, detail="Engine not initialized")
 
-    provider = engine.get_default_provider()
+    provider = state.engine.get_default_provider()
     if not provider:
         raise HTTPException(status_code=404, detail="No LLM provider available")
 
-    messages: list[ChatMessage] = []
-    if body.system_prompt:
-        messages.append(ChatMessage(role=ChatRole.SYSTEM, content=body.system_prompt))
-    messages.append(ChatMessage(role=ChatRole.USER, content=body.message))
+    messages = _build_messages(body)
 
-    async def generate():
+    async def generate() -> AsyncIterator[tuple[str, str]]:
         try:
             async for chunk in provider.chat_stream(messages):
-                yield f"data: {chunk}\n\n"
-            yield "data: [DONE]\n\n"
+                yield "token", chunk
+            yield "done", ""
         except Exception as e:
-            yield f"data: [ERROR] {str(e)}\n\n"
+            yield "error", str(e)
 
-    return StreamingResponse(
-        generate(),
-        media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
-    )
+    return _sse_response(generate())
@@ -1,20 +1,46 @@
 """Configuration management routes."""
 
+import asyncio
+import contextlib
+import os
+import shutil
+import stat
+import tempfile
 from pathlib import Path
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict
+
+from aetherpackbot.api.responses import OrjsonResponse
+
+try:
+    import yaml
+except ImportError:  # PyYAML is optional; saving YAML configs needs it
+    yaml = None  # type: ignore[assignment]
+else:
+    try:
+        from yaml import CSafeLoader as _Loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as _Loader  # type: ignore[assignment]
 
 router = APIRouter()
 
 # Default config path
 CONFIG_PATH = Path("config.yaml")
+EXAMPLE_CONFIG_PATH = Path("config.example.yaml")
+
+# (path, mtime_ns, size, encoded response body) of the last config served
+_config_cache: tuple[str, int, int, bytes] | None = None
 
 
 class ConfigResponse(BaseModel):
     """Configuration response."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     content: str
 
 
@@ -24,34 +50,68 @@ class ConfigUpdateRequest(BaseModel):
     content: str
 
 
-@router.get("")
-async def get_config() -> ConfigResponse:
+@router.get("", response_model=ConfigResponse)
+async def get_config(request: Request) -> Response:
     """Get current configuration."""
-    if not CONFIG_PATH.exists():
-        # Try example config
-        example_path = Path("config.example.yaml")
-        if example_path.exists():
-            return ConfigResponse(content=example_path.read_text(encoding="utf-8"))
-        return ConfigResponse(content="# 配置文件不存在\n")
-
-    return ConfigResponse(content=CONFIG_PATH.read_text(encoding="utf-8"))
+    global _config_cache
+
+    # Fall back to the example config when no config file exists
+    for path in (CONFIG_PATH, EXAMPLE_CONFIG_PATH):
+        try:
+            st = path.stat()
+            break
+        except FileNotFoundError:
+            continue
+    else:
+        return OrjsonResponse({"content": "# 配置文件不存在\n"})
+
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    if _config_cache is None or _config_cache[:3] != key:
+        content = path.read_text(encoding="utf-8")
+        _config_cache = (*key, orjson.dumps({"content": content}))
+
+    return Response(content=_config_cache[3], media_type="application/json", headers=headers)
+
+
+def _write_config(content: str) -> None:
+    """Back up the current config and atomically replace it with ``content``."""
+    mode = None
+    if CONFIG_PATH.exists():
+        shutil.copyfile(CONFIG_PATH, CONFIG_PATH.with_suffix(".yaml.bak"))
+        mode = stat.S_IMODE(CONFIG_PATH.stat().st_mode)
+
+    # Write to a temp file in the same directory so os.replace stays atomic
+    fd, tmp_path = tempfile.mkstemp(dir=CONFIG_PATH.parent, prefix=f".{CONFIG_PATH.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, CONFIG_PATH)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
 
 
 @router.post("")
 async def update_config(body: ConfigUpdateRequest) -> dict[str, str]:
     """Update configuration."""
+    if yaml is None:
+        raise HTTPException(status_code=503, detail="PyYAML required: pip install pyyaml")
     try:
         # Validate YAML syntax
-        import yaml
-        yaml.safe_load(body.content)
-
-        # Backup existing config
-        if CONFIG_PATH.exists():
-            backup_path = CONFIG_PATH.with_suffix(".yaml.bak")
-            backup_path.write_text(CONFIG_PATH.read_text(encoding="utf-8"), encoding="utf-8")
+        await asyncio.to_thread(yaml.load, body.content, Loader=_Loader)
 
-        # Write new config
-        CONFIG_PATH.write_text(body.content, encoding="utf-8")
+        # Backup existing config and write the new one off the event loop
+        await asyncio.to_thread(_write_config, body.content)
 
         return {"status": "saved", "message": "配置已保存"}
     except yaml.YAMLError as e:
@@ -72,7 +132,7 @@ async def reload_config(request: Request) -> dict[str, str]:
 
         if CONFIG_PATH.exists():
             new_settings = Settings.from_file(CONFIG_PATH)
-            engine._settings = new_settings
+            engine.settings = new_settings
             return {"status": "reloaded", "message": "配置已重新加载"}
         else:
             raise HTTPException(status_code=404, detail="配置文件不存在")
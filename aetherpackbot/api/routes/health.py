@@ -1,31 +1,43 @@
 """Health check routes."""
 
-from fastapi import APIRouter, Response
-from pydantic import BaseModel
+import orjson
+from fastapi import APIRouter
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict
+
+from aetherpackbot import __version__
 
 router = APIRouter()
 
+# Probe bodies never change, so encode them once. Responses are still built per
+# request because middleware may mutate their headers.
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "version": __version__})
+_READY_BODY = b'{"ready":true}'
+_LIVE_BODY = b'{"alive":true}'
+
 
 class HealthResponse(BaseModel):
     """Health check response."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     status: str
     version: str
 
 
-@router.get("/health")
-async def health_check() -> HealthResponse:
+@router.get("/health", response_model=HealthResponse)
+async def health_check() -> Response:
     """Check API health status."""
-    return HealthResponse(status="healthy", version="1.0.0")
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/ready")
-async def readiness_check() -> dict[str, bool]:
+async def readiness_check() -> Response:
     """Check if service is ready to accept requests."""
-    return {"ready": True}
+    return Response(content=_READY_BODY, media_type="application/json")
 
 
 @router.get("/live")
-async def liveness_check(response: Response) -> dict[str, bool]:
+async def liveness_check() -> Response:
     """Check if service is alive."""
-    return {"alive": True}
+    return Response(content=_LIVE_BODY, media_type="application/json")
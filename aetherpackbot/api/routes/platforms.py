@@ -1,14 +1,29 @@
 """Platform management routes."""
 
-from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict
+
+from aetherpackbot.api.cache import cached_json
+from aetherpackbot.api.responses import OrjsonResponse
+
+if TYPE_CHECKING:
+    from aetherpackbot.platforms.base import Platform
 
 router = APIRouter()
 
+logger = structlog.get_logger(__name__)
+
 
 class PlatformInfo(BaseModel):
     """Platform information response."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     name: str
     connected: bool
     type: str
@@ -17,28 +32,33 @@ class PlatformInfo(BaseModel):
 class PlatformListResponse(BaseModel):
     """List of platforms response."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     platforms: list[PlatformInfo]
     total: int
 
 
-@router.get("")
-async def list_platforms(request: Request) -> PlatformListResponse:
+@router.get("", response_model=PlatformListResponse)
+async def list_platforms(request: Request) -> Response:
     """List all registered platforms."""
     engine = request.app.state.engine
     if not engine:
-        return PlatformListResponse(platforms=[], total=0)
+        return OrjsonResponse({"platforms": [], "total": 0})
 
-    platforms = []
-    for name, platform in engine._platforms.items():
-        platforms.append(
-            PlatformInfo(
+    def build() -> dict[str, Any]:
+        platforms = [
+            PlatformInfo.model_construct(
                 name=name,
                 connected=platform.is_connected,
                 type=platform.name,
             )
-        )
+            for name, platform in engine._platforms.items()
+        ]
+        return PlatformListResponse.model_construct(platforms=platforms, total=len(platforms)).model_dump()
 
-    return PlatformListResponse(platforms=platforms, total=len(platforms))
+    # Connection state changes without re-registration, so it is part of the key
+    key = (engine._registry_version, tuple(p.is_connected for p in engine._platforms.values()))
+    return cached_json(request.app.state, "platforms_cache", key, build)
 
 
 @router.get("/{name}")
@@ -59,9 +79,56 @@ async def get_platform(request: Request, name: str) -> PlatformInfo:
     )
 
 
+async def _reconnect(platform: "Platform") -> None:
+    """Restart a platform connection."""
+    await platform.stop()
+    await platform.start()
+
+
+async def _start_in_background(name: str, platform: "Platform") -> None:
+    """Start a platform after the response has been sent, logging failures."""
+    try:
+        await platform.start()
+    except Exception:
+        logger.exception("platform_reconnect_failed", name=name)
+
+
+@router.post("/reconnect_all")
+async def reconnect_all_platforms(request: Request) -> dict[str, Any]:
+    """Reconnect all platforms concurrently."""
+    engine = request.app.state.engine
+    if not engine:
+        raise HTTPException(status_code=503, detail="Engine not initialized")
+
+    names = list(engine._platforms)
+    results = await asyncio.gather(
+        *(_reconnect(platform) for platform in engine._platforms.values()),
+        return_exceptions=True,
+    )
+
+    return {
+        "results": [
+            {"name": name, "status": "ok"}
+            if result is None
+            else {"name": name, "status": "error", "detail": str(result)}
+            for name, result in zip(names, results)
+        ]
+    }
+
+
 @router.post("/{name}/reconnect")
-async def reconnect_platform(request: Request, name: str) -> dict[str, str]:
-    """Reconnect a platform."""
+async def reconnect_platform(
+    request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    name: str,
+    wait: bool = True,
+) -> dict[str, str]:
+    """Reconnect a platform.
+
+    With ``wait=false`` the platform is stopped and the restart runs after the
+    response is sent (202), for platforms with slow handshakes.
+    """
     engine = request.app.state.engine
     if not engine:
         raise HTTPException(status_code=503, detail="Engine not initialized")
@@ -71,8 +138,13 @@ async def reconnect_platform(request: Request, name: str) -> dict[str, str]:
         raise HTTPException(status_code=404, detail=f"Platform '{name}' not found")
 
     try:
-        await platform.stop()
-        await platform.start()
+        if not wait:
+            await platform.stop()
+            background_tasks.add_task(_start_in_background, name, platform)
+            response.status_code = 202
+            return {"status": "reconnecting", "name": name}
+
+        await _reconnect(platform)
         return {"status": "reconnected", "name": name}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
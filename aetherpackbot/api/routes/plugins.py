@@ -3,7 +3,11 @@
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict
+
+from aetherpackbot.api.cache import cached_json
+from aetherpackbot.api.responses import OrjsonResponse
 
 router = APIRouter()
 
@@ -11,6 +15,8 @@ router = APIRouter()
 class PluginInfo(BaseModel):
     """Plugin information response."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     name: str
     version: str
     description: str
@@ -20,29 +26,32 @@ class PluginInfo(BaseModel):
 class PluginListResponse(BaseModel):
     """List of plugins response."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     plugins: list[PluginInfo]
     total: int
 
 
-@router.get("")
-async def list_plugins(request: Request) -> PluginListResponse:
+@router.get("", response_model=PluginListResponse)
+async def list_plugins(request: Request) -> Response:
     """List all loaded plugins."""
     engine = request.app.state.engine
     if not engine:
-        return PluginListResponse(plugins=[], total=0)
-
-    plugins = []
-    for _, plugin in engine._plugins.items():
-        plugins.append(
-            PluginInfo(
-                name=plugin.meta.name,
-                version=plugin.meta.version,
-                description=plugin.meta.description,
-                enabled=plugin.meta.enabled,
+        return OrjsonResponse({"plugins": [], "total": 0})
+
+    def build() -> dict[str, Any]:
+        plugins = [
+            PluginInfo.model_construct(
+                name=p.meta.name,
+                version=p.meta.version,
+                description=p.meta.description,
+                enabled=p.meta.enabled,
             )
-        )
+            for p in engine._plugins.values()
+        ]
+        return PluginListResponse.model_construct(plugins=plugins, total=len(plugins)).model_dump()
 
-    return PluginListResponse(plugins=plugins, total=len(plugins))
+    return cached_json(request.app.state, "plugins_cache", engine._registry_version, build)
 
 
 @router.get("/{name}")
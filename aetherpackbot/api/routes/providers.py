@@ -3,7 +3,11 @@
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict
+
+from aetherpackbot.api.cache import cached_json
+from aetherpackbot.api.responses import OrjsonResponse
 
 router = APIRouter()
 
@@ -11,6 +15,8 @@ router = APIRouter()
 class ProviderInfo(BaseModel):
     """Provider information response."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     name: str
     model: str | None = None
     enabled: bool = True
@@ -19,28 +25,31 @@ class ProviderInfo(BaseModel):
 class ProviderListResponse(BaseModel):
     """List of providers response."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     providers: list[ProviderInfo]
     total: int
 
 
-@router.get("")
-async def list_providers(request: Request) -> ProviderListResponse:
+@router.get("", response_model=ProviderListResponse)
+async def list_providers(request: Request) -> Response:
     """List all registered LLM providers."""
     engine = request.app.state.engine
     if not engine:
-        return ProviderListResponse(providers=[], total=0)
+        return OrjsonResponse({"providers": [], "total": 0})
 
-    providers = []
-    for name, provider in engine._providers.items():
-        providers.append(
-            ProviderInfo(
+    def build() -> dict[str, Any]:
+        providers = [
+            ProviderInfo.model_construct(
                 name=name,
                 model=getattr(provider, 'model', None),
                 enabled=True,
             )
-        )
+            for name, provider in engine._providers.items()
+        ]
+        return ProviderListResponse.model_construct(providers=providers, total=len(providers)).model_dump()
 
-    return ProviderListResponse(providers=providers, total=len(providers))
+    return cached_json(request.app.state, "providers_cache", engine._registry_version, build)
 
 
 @router.get("/{name}")
@@ -37,12 +37,16 @@ class APIServer:
 
             app = create_app(self.engine)
 
+            # The server runs on the engine's loop, so the loop implementation is
+            # chosen by the CLI; the API is SSE-only, so skip WebSocket support.
             config = uvicorn.Config(
                 app,
                 host=self.host,
                 port=self.port,
                 log_level="info",
                 access_log=False,
+                ws="none",
+                lifespan="on",
             )
             self._server = uvicorn.Server(config)
 
@@ -134,6 +134,13 @@ const API = {
         return this.post(`/api/platforms/${name}/reconnect`);
     },
     
+    /**
+     * Reconnect all platforms
+     */
+    async reconnectAllPlatforms() {
+        return this.post('/api/platforms/reconnect_all');
+    },
+    
     // ============================================
     // Providers Endpoints
     // ============================================
@@ -194,22 +201,33 @@ const API = {
         
         const reader = response.body.getReader();
         const decoder = new TextDecoder();
+        let buffer = '';
         
         while (true) {
             const { done, value } = await reader.read();
             if (done) break;
             
-            const chunk = decoder.decode(value);
-            const lines = chunk.split('\n');
+            buffer += decoder.decode(value, { stream: true });
+            const frames = buffer.split(/\r\n\r\n|\n\n/);
+            buffer = frames.pop();
             
-            for (const line of lines) {
-                if (line.startsWith('data: ')) {
-                    const data = line.slice(6);
-                    if (data === '[DONE]') return;
-                    if (data.startsWith('[ERROR]')) {
-                        throw new Error(data.slice(8));
+            for (const frame of frames) {
+                let event = 'message';
+                const data = [];
+                for (const line of frame.split(/\r\n|\n/)) {
+                    if (line.startsWith('event: ')) {
+                        event = line.slice(7);
+                    } else if (line.startsWith('data: ')) {
+                        data.push(line.slice(6));
                     }
-                    yield data;
+                }
+                
+                if (event === 'token') {
+                    yield data.join('\n');
+                } else if (event === 'done') {
+                    return;
+                } else if (event === 'error') {
+                    throw new Error(data.join('\n'));
                 }
             }
         }
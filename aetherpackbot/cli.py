@@ -65,7 +65,14 @@ def main() -> int:
         print(f"AetherPackBot v{__version__}")
         return 0
 
-    # Run the bot
+    # Run the bot on uvloop when available (shipped with uvicorn[standard], not on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     try:
         asyncio.run(run_bot(args))
     except KeyboardInterrupt:
@@ -110,6 +117,9 @@ async def run_bot(args: argparse.Namespace) -> None:
     # Setup providers from config
     await setup_providers(engine, settings)
 
+    # Load plugins from the plugins directory
+    await setup_plugins(engine, settings)
+
     # Start API server if enabled
     if not args.no_api and settings.api.enabled:
         from aetherpackbot.api.server import APIServer
@@ -148,6 +158,17 @@ async def setup_platforms(engine: BotEngine, settings: Settings) -> None:
         engine.register_platform("discord", DiscordPlatform(config))
 
 
+async def setup_plugins(engine: BotEngine, settings: Settings) -> None:
+    """Discover and load plugins from the configured directory."""
+    from aetherpackbot.plugins.loader import PluginLoader
+
+    loader = PluginLoader(engine)
+    loader.add_directory(settings.plugins_dir)
+    # Plugin modules are imported concurrently, off the event loop
+    await loader.load_all(loader.discover())
+    engine.container.register_singleton(PluginLoader, loader)
+
+
 async def setup_providers(engine: BotEngine, settings: Settings) -> None:
     """Setup LLM providers from configuration."""
     # OpenAI
@@ -158,6 +179,7 @@ async def setup_providers(engine: BotEngine, settings: Settings) -> None:
             name="openai",
             api_key=settings.providers.openai["api_key"],
             model=settings.providers.openai.get("model", "gpt-4"),
+            prompt_cache=settings.providers.openai.get("prompt_cache"),
         )
         engine.register_provider("openai", OpenAIProvider(config))
 
@@ -169,6 +191,7 @@ async def setup_providers(engine: BotEngine, settings: Settings) -> None:
             name="anthropic",
             api_key=settings.providers.anthropic["api_key"],
             model=settings.providers.anthropic.get("model", "claude-3-opus-20240229"),
+            prompt_cache=settings.providers.anthropic.get("prompt_cache", True),
         )
         engine.register_provider("anthropic", AnthropicProvider(config))
 
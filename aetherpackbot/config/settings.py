@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    import yaml
+except ImportError:  # PyYAML is optional; JSON configs still work
+    yaml = None  # type: ignore[assignment]
+else:
+    try:
+        from yaml import CSafeDumper as _Dumper
+        from yaml import CSafeLoader as _Loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
+        from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+# Parsed settings keyed by (class, resolved path, mtime_ns, size)
+_SETTINGS_CACHE_SIZE = 16
+_settings_cache: OrderedDict[tuple[type, str, int, int], Settings] = OrderedDict()
+
 
 class BotSettings(BaseSettings):
     """Bot-specific settings."""
@@ -63,7 +80,13 @@ class Settings(BaseSettings):
     debug: bool = False
     data_dir: Path = Path("data")
     plugins_dir: Path = Path("plugins")
+    # Ignore the on-disk plugin discovery cache and rescan plugin directories
+    refresh_plugin_cache: bool = False
     default_provider: str = "openai"
+    # Match /chat prompts against cached paraphrases (needs the 'semantic' extra)
+    semantic_cache: bool = False
+    # Redis connection for queued /chat_async jobs and the shared chat response cache
+    redis_url: str | None = None
 
     # Nested settings
     bot: BotSettings = Field(default_factory=BotSettings)
@@ -78,22 +101,32 @@ class Settings(BaseSettings):
         import json
 
         path = Path(path)
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return cls()
 
+        # Callers mutate the returned settings, so hand out copies of the cached instance
+        key = (cls, str(path.resolve()), st.st_mtime_ns, st.st_size)
+        cached = _settings_cache.get(key)
+        if cached is not None:
+            _settings_cache.move_to_end(key)
+            return cached.model_copy(deep=True)
+
         content = path.read_text()
 
         if path.suffix in (".yaml", ".yml"):
-            try:
-                import yaml
-
-                data = yaml.safe_load(content)
-            except ImportError as e:
-                raise ImportError("PyYAML required for YAML config: pip install pyyaml") from e
+            if yaml is None:
+                raise ImportError("PyYAML required for YAML config: pip install pyyaml")
+            data = yaml.load(content, Loader=_Loader)
         else:
             data = json.loads(content)
 
-        return cls(**data) if data else cls()
+        settings = cls(**data) if data else cls()
+        _settings_cache[key] = settings
+        if len(_settings_cache) > _SETTINGS_CACHE_SIZE:
+            _settings_cache.popitem(last=False)
+        return settings.model_copy(deep=True)
 
     def save(self, path: str | Path) -> None:
         """Save settings to file."""
@@ -102,14 +135,11 @@ class Settings(BaseSettings):
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        if path.suffix in (".yaml", ".yml"):
-            try:
-                import yaml
-
-                content = yaml.dump(self.model_dump(), default_flow_style=False)
-            except ImportError:
-                content = json.dumps(self.model_dump(), indent=2)
+        # mode="json" turns Path fields into strings the safe dumper can represent
+        data = self.model_dump(mode="json")
+        if path.suffix in (".yaml", ".yml") and yaml is not None:
+            content = yaml.dump(data, Dumper=_Dumper, default_flow_style=False)
         else:
-            content = json.dumps(self.model_dump(), indent=2)
+            content = json.dumps(data, indent=2)
 
         path.write_text(content)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, TypeVar, get_type_hints
 
 import structlog
@@ -11,45 +12,48 @@ logger = structlog.get_logger(__name__)
 
 T = TypeVar("T")
 
+# Registration kinds stored alongside each entry in Container._registry
+_SINGLETON = 0
+_INSTANCE = 1
+_FACTORY = 2
+
+
+@lru_cache(maxsize=512)
+def _hints_for(cls: type) -> tuple[tuple[str, Any], ...]:
+    """Get the annotated ``__init__`` parameters of a class, cached per class."""
+    hints = get_type_hints(cls.__init__)
+    hints.pop("return", None)
+    return tuple(hints.items())
+
 
 class Container:
     """Simple dependency injection container."""
 
     def __init__(self) -> None:
-        self._singletons: dict[type, Any] = {}
-        self._factories: dict[type, Callable[..., Any]] = {}
-        self._instances: dict[type, Any] = {}
+        self._registry: dict[type, tuple[int, Any]] = {}
 
     def register_singleton(self, interface: type[T], instance: T) -> None:
         """Register a singleton instance."""
-        self._singletons[interface] = instance
+        self._registry[interface] = (_SINGLETON, instance)
         logger.debug("singleton_registered", type=interface.__name__)
 
     def register_factory(self, interface: type[T], factory: Callable[..., T]) -> None:
         """Register a factory function for creating instances."""
-        self._factories[interface] = factory
+        self._registry[interface] = (_FACTORY, factory)
         logger.debug("factory_registered", type=interface.__name__)
 
     def register_instance(self, interface: type[T], instance: T) -> None:
         """Register a specific instance (creates new each time if factory exists)."""
-        self._instances[interface] = instance
+        self._registry[interface] = (_INSTANCE, instance)
 
     def resolve(self, interface: type[T]) -> T:
         """Resolve a dependency by type."""
-        # Check singletons first
-        if interface in self._singletons:
-            return self._singletons[interface]
-
-        # Check instances
-        if interface in self._instances:
-            return self._instances[interface]
+        entry = self._registry.get(interface)
+        if entry is None:
+            raise KeyError(f"No registration found for {interface.__name__}")
 
-        # Try factory
-        if interface in self._factories:
-            instance = self._factories[interface]()
-            return instance
-
-        raise KeyError(f"No registration found for {interface.__name__}")
+        kind, value = entry
+        return value() if kind == _FACTORY else value
 
     def resolve_optional(self, interface: type[T]) -> T | None:
         """Resolve a dependency, returning None if not found."""
@@ -60,29 +64,20 @@ class Container:
 
     def has(self, interface: type) -> bool:
         """Check if a type is registered."""
-        return (
-            interface in self._singletons
-            or interface in self._factories
-            or interface in self._instances
-        )
+        return interface in self._registry
 
     def create_with_injection(self, cls: type[T]) -> T:
         """Create an instance with automatic dependency injection."""
-        hints = get_type_hints(cls.__init__)
-        hints.pop("return", None)
-
-        kwargs: dict[str, Any] = {}
-        for param_name, param_type in hints.items():
-            if self.has(param_type):
-                kwargs[param_name] = self.resolve(param_type)
-
+        kwargs = {
+            name: self.resolve(param_type)
+            for name, param_type in _hints_for(cls)
+            if self.has(param_type)
+        }
         return cls(**kwargs)
 
     def clear(self) -> None:
         """Clear all registrations."""
-        self._singletons.clear()
-        self._factories.clear()
-        self._instances.clear()
+        self._registry.clear()
 
 
 # Global container instance
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
-from uuid import uuid4
+
+from aetherpackbot.core.ids import next_id
+from aetherpackbot.core.time_cache import now_utc
+from aetherpackbot.messages.message import MessageType
 
 if TYPE_CHECKING:
-    from aetherpackbot.messages.message import Message
+    from aetherpackbot.messages.message import Message, MessageRef
     from aetherpackbot.platforms.base import Platform
 
+# Command token, plus the whitespace separating it from the arguments
+_COMMAND_RE = re.compile(r"/(\S*)\s*")
+
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Represents a user across platforms."""
 
@@ -23,8 +30,27 @@ class User:
     is_bot: bool = False
     metadata: dict[str, Any] = field(default_factory=dict)
 
-
-@dataclass
+    @classmethod
+    def _fast_new(
+        cls,
+        id: str,
+        platform_id: str,
+        username: str | None,
+        display_name: str | None,
+        is_bot: bool,
+    ) -> User:
+        """Construct without running the dataclass ``__init__``; keep in sync with the fields."""
+        u = object.__new__(cls)
+        u.id = id
+        u.platform_id = platform_id
+        u.username = username
+        u.display_name = display_name
+        u.is_bot = is_bot
+        u.metadata = {}
+        return u
+
+
+@dataclass(slots=True)
 class Chat:
     """Represents a chat/conversation context."""
 
@@ -34,35 +60,77 @@ class Chat:
     title: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def _fast_new(cls, id: str, platform_id: str, type: str, title: str | None) -> Chat:
+        """Construct without running the dataclass ``__init__``; keep in sync with the fields."""
+        c = object.__new__(cls)
+        c.id = id
+        c.platform_id = platform_id
+        c.type = type
+        c.title = title
+        c.metadata = {}
+        return c
 
-@dataclass
+
+@dataclass(slots=True)
 class Context:
     """Request context carrying all information about a message interaction."""
 
-    id: str = field(default_factory=lambda: uuid4().hex[:16])
+    id: str = field(default_factory=next_id)
     message: Message | None = None
     user: User | None = None
     chat: Chat | None = None
     platform: Platform | None = None
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-
-    # State management
-    _state: dict[str, Any] = field(default_factory=dict)
-    _responses: list[Message] = field(default_factory=list)
+    timestamp: datetime = field(default_factory=now_utc)
+
+    # State management; allocated on first write since most contexts never use them
+    _state: dict[str, Any] | None = None
+    _responses: list[MessageRef] | None = None
+    _parts: list[str] | None = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def _fast_new(
+        cls,
+        message: Message,
+        user: User,
+        chat: Chat,
+        platform: Platform,
+        timestamp: datetime,
+    ) -> Context:
+        """Construct for an inbound message without running the dataclass ``__init__``.
+
+        Used by platform adapters on the per-message path; keep in sync with
+        the fields above.
+        """
+        c = object.__new__(cls)
+        c.id = next_id()
+        c.message = message
+        c.user = user
+        c.chat = chat
+        c.platform = platform
+        c.timestamp = timestamp
+        c._state = None
+        c._responses = None
+        c._parts = None
+        return c
 
     def set(self, key: str, value: Any) -> None:
         """Store a value in context state."""
+        if self._state is None:
+            self._state = {}
         self._state[key] = value
 
     def get(self, key: str, default: Any = None) -> Any:
         """Retrieve a value from context state."""
+        if self._state is None:
+            return default
         return self._state.get(key, default)
 
     def has(self, key: str) -> bool:
         """Check if a key exists in state."""
-        return key in self._state
+        return self._state is not None and key in self._state
 
-    async def reply(self, content: str, **kwargs: Any) -> Message | None:
+    async def reply(self, content: str, **kwargs: Any) -> MessageRef | None:
         """Send a reply to the current chat."""
         if self.platform and self.chat:
             from aetherpackbot.messages.message import Message, TextContent
@@ -74,6 +142,8 @@ class Context:
             )
             result = await self.platform.send_message(msg)
             if result:
+                if self._responses is None:
+                    self._responses = []
                 self._responses.append(result)
             return result
         return None
@@ -86,28 +156,39 @@ class Context:
     @property
     def text(self) -> str:
         """Get message text content."""
-        if self.message and hasattr(self.message.content, "text"):
-            return self.message.content.text
-        return ""
+        m = self.message
+        return m.content.text if m is not None and m.content.type is MessageType.TEXT else ""
+
+    @property
+    def _parts_cached(self) -> list[str]:
+        """Whitespace-split message text, computed once per context."""
+        if self._parts is None:
+            self._parts = self.text.split()
+        return self._parts
 
     @property
     def is_command(self) -> bool:
         """Check if message starts with a command prefix."""
-        return self.text.startswith("/")
+        return self.text[:1] == "/"
 
     @property
     def command(self) -> str | None:
         """Extract command name without prefix."""
-        if self.is_command:
-            parts = self.text.split()
-            if parts:
-                return parts[0][1:].lower()
-        return None
+        # Matches only the leading token, so long messages aren't split just to route them
+        match = _COMMAND_RE.match(self.text)
+        return match[1].lower() if match else None
 
     @property
     def args(self) -> list[str]:
         """Get command arguments."""
         if self.is_command:
-            parts = self.text.split()
-            return parts[1:] if len(parts) > 1 else []
+            return self._parts_cached[1:]
         return []
+
+    @property
+    def raw_args(self) -> str:
+        """Get the text after the command token, with its original spacing."""
+        text = self.text
+        match = _COMMAND_RE.match(text)
+        # One slice of the original text; no split or re-join
+        return text[match.end() :].rstrip() if match else ""
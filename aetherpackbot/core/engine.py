@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import asyncio
 import signal
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
 from aetherpackbot.core.container import Container, get_container
-from aetherpackbot.core.events import Event, EventBus, get_event_bus
+from aetherpackbot.core.events import Event, EventBus, EventPriority, get_event_bus
 
 if TYPE_CHECKING:
     from aetherpackbot.config.settings import Settings
+    from aetherpackbot.core.context import Context
     from aetherpackbot.platforms.base import Platform
     from aetherpackbot.plugins.base import Plugin
     from aetherpackbot.providers.base import LLMProvider
@@ -20,16 +22,23 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
+@dataclass(slots=True)
 class EngineStartedEvent(Event):
     """Fired when engine completes startup."""
 
-    pass
-
 
+@dataclass(slots=True)
 class EngineStoppingEvent(Event):
     """Fired when engine begins shutdown."""
 
-    pass
+
+def _same_plugin(a: Any, b: Any) -> bool:
+    """Whether two handler owners are instances of the same plugin."""
+    if a is None or b is None:
+        return False
+    # A reloaded module defines a new class object under the same module and name
+    ta, tb = type(a), type(b)
+    return a is b or (ta.__module__ == tb.__module__ and ta.__qualname__ == tb.__qualname__)
 
 
 class BotEngine:
@@ -47,6 +56,16 @@ class BotEngine:
         self._platforms: dict[str, Platform] = {}
         self._providers: dict[str, LLMProvider] = {}
         self._plugins: dict[str, Plugin] = {}
+        # Tuple snapshots of the registries for start/stop iteration, rebuilt on registration
+        self._platforms_frozen: tuple[tuple[str, Platform], ...] = ()
+        self._plugins_frozen: tuple[tuple[str, Plugin], ...] = ()
+        # Command name or alias -> handler, across all plugins
+        self._command_table: dict[str, Any] = {}
+        # Resolved lazily; cleared whenever providers or settings change
+        self._default_provider: LLMProvider | None = None
+        self._default_provider_stale = True
+        # Bumped on every registration so API responses can be cached between changes
+        self._registry_version = 0
         self._running = False
         self._shutdown_event = asyncio.Event()
 
@@ -63,23 +82,104 @@ class BotEngine:
             self._settings = Settings()
         return self._settings
 
+    @settings.setter
+    def settings(self, settings: Settings) -> None:
+        self._settings = settings
+        self._default_provider_stale = True
+
     def register_platform(self, name: str, platform: Platform) -> None:
         """Register a messaging platform adapter."""
         self._platforms[name] = platform
+        self._platforms_frozen = tuple(self._platforms.items())
+        self._registry_version += 1
         platform.engine = self
         logger.info("platform_registered", name=name)
 
     def register_provider(self, name: str, provider: LLMProvider) -> None:
         """Register an LLM provider."""
         self._providers[name] = provider
+        self._default_provider_stale = True
+        self._registry_version += 1
         logger.info("provider_registered", name=name)
 
     def register_plugin(self, name: str, plugin: Plugin) -> None:
-        """Register a plugin."""
+        """Register a plugin, replacing any plugin already registered under ``name``."""
+        replacing = self._plugins.get(name) is not plugin
+        if replacing:
+            self.unregister_plugin(name)
         self._plugins[name] = plugin
+        self._plugins_frozen = tuple(self._plugins.items())
+        self._registry_version += 1
         plugin.engine = self
+        for cmd_name, cmd_info in plugin.commands.items():
+            self.register_command(cmd_name, cmd_info["handler"], cmd_info["aliases"])
+        # Re-registering the same instance must not subscribe its handlers twice
+        for event_type, buckets in plugin.event_handlers.items() if replacing else ():
+            for level, handlers in buckets.items():
+                for handler in handlers:
+                    self.event_bus.subscribe(event_type, handler, EventPriority(level))
         logger.info("plugin_registered", name=name)
 
+    def unregister_plugin(self, name: str) -> Plugin | None:
+        """Remove a plugin and every command routed to it."""
+        plugin = self._plugins.pop(name, None)
+        if plugin is None:
+            return None
+        self._plugins_frozen = tuple(self._plugins.items())
+        self._registry_version += 1
+        owned = {id(cmd_info["handler"]) for cmd_info in plugin.commands.values()}
+        self._command_table = {
+            key: handler
+            for key, handler in self._command_table.items()
+            if id(handler) not in owned and getattr(handler, "__self__", None) is not plugin
+        }
+        for event_type, buckets in plugin.event_handlers.items():
+            for handlers in buckets.values():
+                for handler in handlers:
+                    self.event_bus.unsubscribe(event_type, handler)
+        logger.info("plugin_unregistered", name=name)
+        return plugin
+
+    def register_command(self, name: str, handler: Any, aliases: list[str] | None = None) -> None:
+        """Route a command name and its aliases to a handler; names win over aliases.
+
+        An alias already routed to another plugin is left alone unless that
+        entry belongs to the same plugin (e.g. a reloaded instance).
+        """
+        table = self._command_table
+        table[name] = handler
+        owner = getattr(handler, "__self__", None)
+        for alias in aliases or ():
+            current = table.get(alias)
+            if current is None or (
+                _same_plugin(owner, getattr(current, "__self__", None))
+                and alias not in owner.commands
+            ):
+                table[alias] = handler
+
+    async def handle_message(self, context: Context) -> bool:
+        """Dispatch an inbound message. Returns True if something handled it.
+
+        Commands are resolved with one lookup in the command table; other
+        messages are offered to each plugin's ``on_message`` in turn.
+        """
+        name = context.command
+        if name is not None:
+            handler = self._command_table.get(name)
+            if handler is not None:
+                try:
+                    await handler(context)
+                except Exception:
+                    logger.exception("command_failed", command=name)
+                return True
+        for name, plugin in self._plugins_frozen:
+            try:
+                if await plugin.on_message(context):
+                    return True
+            except Exception:
+                logger.exception("plugin_message_failed", name=name)
+        return False
+
     def get_platform(self, name: str) -> Platform | None:
         """Get a registered platform by name."""
         return self._platforms.get(name)
@@ -90,6 +190,13 @@ class BotEngine:
 
     def get_default_provider(self) -> LLMProvider | None:
         """Get the default LLM provider."""
+        if self._default_provider_stale:
+            self._default_provider = self._resolve_default_provider()
+            self._default_provider_stale = False
+        return self._default_provider
+
+    def _resolve_default_provider(self) -> LLMProvider | None:
+        """Pick the configured default provider, falling back to the first registered."""
         if not self._providers:
             return None
         default_name = self.settings.default_provider
@@ -107,7 +214,7 @@ class BotEngine:
         self._running = True
 
         # Initialize plugins
-        for name, plugin in self._plugins.items():
+        for name, plugin in self._plugins_frozen:
             try:
                 await plugin.on_load()
                 logger.info("plugin_loaded", name=name)
@@ -116,7 +223,7 @@ class BotEngine:
 
         # Start platforms
         platform_tasks = []
-        for name, platform in self._platforms.items():
+        for name, platform in self._platforms_frozen:
             try:
                 task = asyncio.create_task(platform.start())
                 platform_tasks.append(task)
@@ -124,6 +231,8 @@ class BotEngine:
             except Exception:
                 logger.exception("platform_start_failed", name=name)
 
+        # Resolve the default provider up front so the first message doesn't pay for it
+        self.get_default_provider()
         await self.event_bus.emit(EngineStartedEvent())
         logger.info("engine_started")
 
@@ -139,7 +248,7 @@ class BotEngine:
         await self.event_bus.emit(EngineStoppingEvent())
 
         # Stop platforms
-        for name, platform in self._platforms.items():
+        for name, platform in self._platforms_frozen:
             try:
                 await platform.stop()
                 logger.info("platform_stopped", name=name)
@@ -147,7 +256,7 @@ class BotEngine:
                 logger.exception("platform_stop_failed", name=name)
 
         # Unload plugins
-        for name, plugin in self._plugins.items():
+        for name, plugin in self._plugins_frozen:
             try:
                 await plugin.on_unload()
                 logger.info("plugin_unloaded", name=name)
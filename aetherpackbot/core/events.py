@@ -3,21 +3,29 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+import bisect
+import logging
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import IntEnum
 from typing import Any, TypeVar
-from uuid import uuid4
 
 import structlog
 
+from aetherpackbot.core.ids import next_id
+from aetherpackbot.core.time_cache import now_utc
+
 logger = structlog.get_logger(__name__)
+# Stdlib logger of the same name, used for cheap level checks on hot-path debug logs
+_std_logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound="Event")
 EventHandler = Callable[[T], Awaitable[None]]
 
+# asyncio.TaskGroup is 3.11+; 3.10 falls back to gather
+_TaskGroup = getattr(asyncio, "TaskGroup", None)
+
 
 class EventPriority(IntEnum):
     """Handler execution priority. Lower values execute first."""
@@ -30,12 +38,12 @@ class EventPriority(IntEnum):
     MONITOR = 1000  # For logging/analytics, always last
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Base event class. All events inherit from this."""
 
-    id: str = field(default_factory=lambda: uuid4().hex[:12])
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    id: str = field(default_factory=next_id)
+    timestamp: datetime = field(default_factory=now_utc)
     cancelled: bool = field(default=False)
     metadata: dict[str, Any] = field(default_factory=dict)
 
@@ -44,7 +52,7 @@ class Event:
         self.cancelled = True
 
 
-@dataclass
+@dataclass(slots=True)
 class HandlerInfo:
     """Information about a registered handler."""
 
@@ -53,12 +61,25 @@ class HandlerInfo:
     once: bool = False
 
 
+def _priority(info: HandlerInfo) -> EventPriority:
+    return info.priority
+
+
+async def _guarded(handler: EventHandler, event: Event) -> None:
+    """Run a handler for emit_parallel, logging instead of raising on error."""
+    try:
+        await handler(event)
+    except Exception:
+        logger.exception("parallel_handler_error")
+
+
 class EventBus:
     """Async event bus with priority-based dispatch."""
 
     def __init__(self) -> None:
-        self._handlers: dict[type[Event], list[HandlerInfo]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+        # Each entry is an immutable, priority-sorted tuple. Subscription changes
+        # publish a new tuple, so emit can iterate without locking or copying.
+        self._handlers: dict[type[Event], tuple[HandlerInfo, ...]] = {}
 
     def on(
         self,
@@ -83,31 +104,37 @@ class EventBus:
     ) -> None:
         """Register a handler for an event type."""
         info = HandlerInfo(handler=handler, priority=priority, once=once)
-        handlers = self._handlers[event_type]
-        handlers.append(info)
-        handlers.sort(key=lambda h: h.priority)
-        logger.debug("handler_registered", event=event_type.__name__, priority=priority.name)
+        # bisect_right keeps equal priorities in registration order
+        handlers = self._handlers.get(event_type, ())
+        i = bisect.bisect_right(handlers, priority, key=_priority)
+        self._handlers[event_type] = (*handlers[:i], info, *handlers[i:])
+        if _std_logger.isEnabledFor(logging.DEBUG):
+            logger.debug("handler_registered", event_type=event_type.__name__, priority=priority.name)
 
     def unsubscribe(self, event_type: type[T], handler: EventHandler[T]) -> bool:
         """Remove a handler. Returns True if found and removed."""
-        handlers = self._handlers.get(event_type, [])
+        handlers = self._handlers.get(event_type, ())
         for i, info in enumerate(handlers):
             if info.handler is handler:
-                handlers.pop(i)
-                logger.debug("handler_removed", event=event_type.__name__)
+                self._handlers[event_type] = handlers[:i] + handlers[i + 1 :]
+                if _std_logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("handler_removed", event_type=event_type.__name__)
                 return True
         return False
 
     async def emit(self, event: Event) -> Event:
         """Emit an event to all registered handlers."""
         event_type = type(event)
-        handlers = list(self._handlers.get(event_type, []))
+        handlers = self._handlers.get(event_type)
+        if not handlers:
+            return event
 
         to_remove: list[HandlerInfo] = []
 
         for info in handlers:
             if event.cancelled:
-                logger.debug("event_cancelled", event_id=event.id)
+                if _std_logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("event_cancelled", event_id=event.id)
                 break
 
             try:
@@ -115,32 +142,40 @@ class EventBus:
                 if info.once:
                     to_remove.append(info)
             except Exception:
-                logger.exception("handler_error", event=event_type.__name__)
+                logger.exception("handler_error", event_type=event_type.__name__)
 
         # Remove one-time handlers
-        for info in to_remove:
-            self._handlers[event_type].remove(info)
+        if to_remove:
+            self._handlers[event_type] = tuple(
+                info
+                for info in self._handlers.get(event_type, ())
+                if not any(info is done for done in to_remove)
+            )
 
         return event
 
     async def emit_parallel(self, event: Event) -> Event:
         """Emit event to all handlers in parallel (ignores priority)."""
         event_type = type(event)
-        handlers = self._handlers.get(event_type, [])
-
-        tasks = [info.handler(event) for info in handlers]
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.exception("parallel_handler_error", error=str(result))
+        handlers = self._handlers.get(event_type)
+        if not handlers:
+            return event
+
+        # _guarded swallows and logs errors, so one failing handler never
+        # cancels its siblings in the task group
+        if _TaskGroup is not None:
+            async with _TaskGroup() as tg:
+                for info in handlers:
+                    tg.create_task(_guarded(info.handler, event))
+        else:
+            await asyncio.gather(*[_guarded(info.handler, event) for info in handlers])
 
         return event
 
     def clear(self, event_type: type[Event] | None = None) -> None:
         """Clear handlers for a specific event or all events."""
         if event_type:
-            self._handlers[event_type].clear()
+            self._handlers.pop(event_type, None)
         else:
             self._handlers.clear()
 
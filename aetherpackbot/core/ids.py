@@ -0,0 +1,16 @@
+"""Cheap process-unique identifiers for contexts, messages and events."""
+
+from __future__ import annotations
+
+import itertools
+import os
+import time
+
+# Process id mixed with the import time keeps ids distinct across restarts
+_PREFIX = f"{(os.getpid() ^ time.time_ns()) & 0xFFFFFFFFFF:x}-"
+_counter = itertools.count()
+
+
+def next_id() -> str:
+    """Return a new identifier, unique within this process."""
+    return _PREFIX + format(next(_counter), "x")
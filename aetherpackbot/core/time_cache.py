@@ -0,0 +1,26 @@
+"""Coarse cached wall clock for timestamping contexts, messages and events."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+# Timestamps taken within this many seconds of each other share one datetime
+_RESOLUTION = 0.001
+
+_cached = datetime.now(timezone.utc)
+_cached_at = time.monotonic()
+
+
+def now_utc() -> datetime:
+    """Return the current UTC time, reusing the last value within the resolution window.
+
+    ``datetime`` objects are immutable, so handing out the same instance to
+    everything created in one burst is safe.
+    """
+    global _cached, _cached_at
+    t = time.monotonic()
+    if t - _cached_at >= _RESOLUTION:
+        _cached = datetime.now(timezone.utc)
+        _cached_at = t
+    return _cached
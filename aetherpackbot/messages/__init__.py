@@ -5,17 +5,21 @@ from aetherpackbot.messages.message import (
     FileContent,
     ImageContent,
     Message,
+    MessageRef,
     MessageType,
     TextContent,
     VideoContent,
+    extract_text,
 )
 
 __all__ = [
     "Message",
+    "MessageRef",
     "TextContent",
     "ImageContent",
     "FileContent",
     "AudioContent",
     "VideoContent",
     "MessageType",
+    "extract_text",
 ]
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum, auto
-from typing import Any
-from uuid import uuid4
+from typing import Any, ClassVar, NamedTuple
+
+from aetherpackbot.core.ids import next_id
+from aetherpackbot.core.time_cache import now_utc
 
 
 class MessageType(Enum):
@@ -23,22 +25,22 @@ class MessageType(Enum):
     UNKNOWN = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class TextContent:
     """Text message content."""
 
+    type: ClassVar[MessageType] = MessageType.TEXT
+
     text: str
     entities: list[dict[str, Any]] = field(default_factory=list)
 
-    @property
-    def type(self) -> MessageType:
-        return MessageType.TEXT
-
 
-@dataclass
+@dataclass(slots=True)
 class ImageContent:
     """Image message content."""
 
+    type: ClassVar[MessageType] = MessageType.IMAGE
+
     url: str | None = None
     file_id: str | None = None
     data: bytes | None = None
@@ -47,15 +49,13 @@ class ImageContent:
     height: int | None = None
     caption: str | None = None
 
-    @property
-    def type(self) -> MessageType:
-        return MessageType.IMAGE
-
 
-@dataclass
+@dataclass(slots=True)
 class AudioContent:
     """Audio message content."""
 
+    type: ClassVar[MessageType] = MessageType.AUDIO
+
     url: str | None = None
     file_id: str | None = None
     data: bytes | None = None
@@ -63,15 +63,13 @@ class AudioContent:
     duration: int | None = None
     title: str | None = None
 
-    @property
-    def type(self) -> MessageType:
-        return MessageType.AUDIO
-
 
-@dataclass
+@dataclass(slots=True)
 class VideoContent:
     """Video message content."""
 
+    type: ClassVar[MessageType] = MessageType.VIDEO
+
     url: str | None = None
     file_id: str | None = None
     data: bytes | None = None
@@ -81,15 +79,13 @@ class VideoContent:
     duration: int | None = None
     caption: str | None = None
 
-    @property
-    def type(self) -> MessageType:
-        return MessageType.VIDEO
 
-
-@dataclass
+@dataclass(slots=True)
 class FileContent:
     """File/document message content."""
 
+    type: ClassVar[MessageType] = MessageType.FILE
+
     url: str | None = None
     file_id: str | None = None
     data: bytes | None = None
@@ -97,27 +93,70 @@ class FileContent:
     mime_type: str = "application/octet-stream"
     size: int | None = None
 
-    @property
-    def type(self) -> MessageType:
-        return MessageType.FILE
-
 
 ContentType = TextContent | ImageContent | AudioContent | VideoContent | FileContent
 
+# Content types whose caption stands in for text when sending
+_CAPTIONED = (MessageType.IMAGE, MessageType.VIDEO)
+
+
+def extract_text(message: Message) -> str:
+    """Return the text to send for a message: its text, or the media caption."""
+    content = message.content
+    if content.type is MessageType.TEXT:
+        return content.text
+    if content.type in _CAPTIONED:
+        return content.caption or ""
+    return ""
+
 
-@dataclass
+class MessageRef(NamedTuple):
+    """Lightweight reference to a message a platform has sent."""
+
+    id: str
+    chat_id: str
+    text: str
+
+
+@dataclass(slots=True)
 class Message:
     """Universal message representation across platforms."""
 
-    id: str = field(default_factory=lambda: uuid4().hex[:16])
+    id: str = field(default_factory=next_id)
     content: ContentType = field(default_factory=lambda: TextContent(text=""))
     chat_id: str = ""
     sender_id: str | None = None
     reply_to_id: str | None = None
     thread_id: str | None = None
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=now_utc)
     platform_data: dict[str, Any] = field(default_factory=dict)
 
+    @classmethod
+    def _fast_new(
+        cls,
+        id: str,
+        content: ContentType,
+        chat_id: str,
+        sender_id: str | None,
+        timestamp: datetime,
+        platform_data: dict[str, Any],
+    ) -> Message:
+        """Construct an inbound message without running the dataclass ``__init__``.
+
+        Used by platform adapters on the per-message path; keep in sync with
+        the fields above.
+        """
+        m = object.__new__(cls)
+        m.id = id
+        m.content = content
+        m.chat_id = chat_id
+        m.sender_id = sender_id
+        m.reply_to_id = None
+        m.thread_id = None
+        m.timestamp = timestamp
+        m.platform_data = platform_data
+        return m
+
     @property
     def type(self) -> MessageType:
         """Get the message type based on content."""
@@ -126,8 +165,9 @@ class Message:
     @property
     def text(self) -> str:
         """Get text content if available."""
-        if isinstance(self.content, TextContent):
-            return self.content.text
+        content = self.content
+        if content.type is MessageType.TEXT:
+            return content.text
         return ""
 
     @classmethod
@@ -9,10 +9,10 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from aetherpackbot.core.context import Context
     from aetherpackbot.core.engine import BotEngine
-    from aetherpackbot.messages.message import Message
+    from aetherpackbot.messages.message import Message, MessageRef
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformConfig:
     """Base configuration for platforms."""
 
@@ -42,7 +42,7 @@ class Platform(ABC):
         ...
 
     @abstractmethod
-    async def send_message(self, message: Message) -> Message | None:
+    async def send_message(self, message: Message) -> MessageRef | None:
         """Send a message through the platform."""
         ...
 
@@ -52,8 +52,9 @@ class Platform(ABC):
         ...
 
     async def on_message(self, context: Context) -> None:
-        """Handle incoming message. Override in subclass."""
-        pass
+        """Handle incoming message by routing it through the engine."""
+        if self.engine is not None:
+            await self.engine.handle_message(context)
 
     @property
     def is_connected(self) -> bool:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 
@@ -9,13 +10,22 @@ import structlog
 
 from aetherpackbot.core.context import Chat, Context, User
 from aetherpackbot.core.events import Event
-from aetherpackbot.messages.message import Message, TextContent
+from aetherpackbot.core.time_cache import now_utc
+from aetherpackbot.messages.message import Message, MessageRef, TextContent, extract_text
 from aetherpackbot.platforms.base import Platform, PlatformConfig
 
+try:
+    import discord
+except ImportError:
+    discord = None
+
 logger = structlog.get_logger(__name__)
 
+# How long stop() waits for the client task to wind down after close()
+_STOP_TIMEOUT = 10.0
+
 
-@dataclass
+@dataclass(slots=True)
 class DiscordConfig(PlatformConfig):
     """Discord-specific configuration."""
 
@@ -24,12 +34,19 @@ class DiscordConfig(PlatformConfig):
     intents: list[str] | None = None
 
 
+@dataclass(slots=True)
 class DiscordMessageEvent(Event):
     """Event fired when a Discord message is received."""
 
     context: Context | None = None
 
 
+def _log_client_exit(task: asyncio.Task[None]) -> None:
+    """Surface errors from the background client task instead of dropping them."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("discord_client_failed", exc_info=task.exception())
+
+
 class DiscordPlatform(Platform):
     """Discord.py adapter."""
 
@@ -39,12 +56,15 @@ class DiscordPlatform(Platform):
         super().__init__(config)
         self._client = None
         self._token = config.token
+        self._bg_task: asyncio.Task[None] | None = None
 
     async def start(self) -> None:
         """Start the Discord bot."""
-        try:
-            import discord
+        if discord is None:
+            logger.error("discord_not_installed", hint="pip install discord.py")
+            raise ImportError("discord.py is not installed")
 
+        try:
             intents = discord.Intents.default()
             intents.message_content = True
             intents.members = True
@@ -62,15 +82,11 @@ class DiscordPlatform(Platform):
                     return
                 await self._handle_message(message)
 
-            # Start client in background
-            import asyncio
-
-            asyncio.create_task(self._client.start(self._token))
+            # Start client in background; keep a reference so the task isn't collected
+            self._bg_task = asyncio.create_task(self._client.start(self._token))
+            self._bg_task.add_done_callback(_log_client_exit)
             logger.info("discord_starting")
 
-        except ImportError:
-            logger.error("discord_not_installed", hint="pip install discord.py")
-            raise
         except Exception:
             logger.exception("discord_start_failed")
             raise
@@ -79,6 +95,14 @@ class DiscordPlatform(Platform):
         """Stop the Discord bot."""
         if self._client:
             await self._client.close()
+        if self._bg_task:
+            try:
+                await asyncio.wait_for(self._bg_task, timeout=_STOP_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("discord_stop_timeout")
+            except Exception:
+                pass  # already logged by _log_client_exit
+            self._bg_task = None
         self._connected = False
         logger.info("discord_stopped")
 
@@ -87,14 +111,15 @@ class DiscordPlatform(Platform):
         ctx = self._build_context(msg)
 
         if self.engine:
-            event = DiscordMessageEvent()
-            event.context = ctx
+            event = DiscordMessageEvent(context=ctx, timestamp=ctx.timestamp)
             await self.engine.event_bus.emit(event)
             await self.on_message(ctx)
 
     def _build_context(self, msg: Any) -> Context:
         """Build context from Discord message."""
-        user = User(
+        # Context and message share one timestamp object
+        now = now_utc()
+        user = User._fast_new(
             id=str(msg.author.id),
             platform_id=f"discord:{msg.author.id}",
             username=msg.author.name,
@@ -103,29 +128,31 @@ class DiscordPlatform(Platform):
         )
 
         chat_type = "private" if msg.guild is None else "group"
-        chat = Chat(
+        chat = Chat._fast_new(
             id=str(msg.channel.id),
             platform_id=f"discord:{msg.channel.id}",
             type=chat_type,
             title=getattr(msg.channel, "name", "DM"),
         )
 
-        message = Message(
+        message = Message._fast_new(
             id=str(msg.id),
             content=TextContent(text=msg.content),
             chat_id=str(msg.channel.id),
             sender_id=str(msg.author.id),
             platform_data={"discord_message": msg},
+            timestamp=now,
         )
 
-        return Context(
+        return Context._fast_new(
             message=message,
             user=user,
             chat=chat,
             platform=self,
+            timestamp=now,
         )
 
-    async def send_message(self, message: Message) -> Message | None:
+    async def send_message(self, message: Message) -> MessageRef | None:
         """Send a message to Discord."""
         if not self._client or not message.chat_id:
             return None
@@ -135,14 +162,10 @@ class DiscordPlatform(Platform):
             if not channel:
                 channel = await self._client.fetch_channel(int(message.chat_id))
 
-            text = message.text or str(message.content)
+            text = extract_text(message)
             result = await channel.send(text)
 
-            return Message(
-                id=str(result.id),
-                content=TextContent(text=text),
-                chat_id=message.chat_id,
-            )
+            return MessageRef(str(result.id), message.chat_id, text)
         except Exception:
             logger.exception("discord_send_failed")
             return None
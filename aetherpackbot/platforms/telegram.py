@@ -9,13 +9,19 @@ import structlog
 
 from aetherpackbot.core.context import Chat, Context, User
 from aetherpackbot.core.events import Event
-from aetherpackbot.messages.message import Message, TextContent
+from aetherpackbot.core.time_cache import now_utc
+from aetherpackbot.messages.message import Message, MessageRef, TextContent, extract_text
 from aetherpackbot.platforms.base import Platform, PlatformConfig
 
+try:
+    from telegram.ext import Application, MessageHandler, filters
+except ImportError:
+    Application = None
+
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TelegramConfig(PlatformConfig):
     """Telegram-specific configuration."""
 
@@ -24,6 +30,7 @@ class TelegramConfig(PlatformConfig):
     timeout: int = 30
 
 
+@dataclass(slots=True)
 class TelegramMessageEvent(Event):
     """Event fired when a Telegram message is received."""
 
@@ -42,9 +49,11 @@ class TelegramPlatform(Platform):
 
     async def start(self) -> None:
         """Start the Telegram bot."""
-        try:
-            from telegram.ext import Application, MessageHandler, filters
+        if Application is None:
+            logger.error("telegram_not_installed", hint="pip install python-telegram-bot")
+            raise ImportError("python-telegram-bot is not installed")
 
+        try:
             self._app = Application.builder().token(self._token).build()
 
             # Register handlers
@@ -60,9 +69,6 @@ class TelegramPlatform(Platform):
             self._connected = True
             logger.info("telegram_started")
 
-        except ImportError:
-            logger.error("telegram_not_installed", hint="pip install python-telegram-bot")
-            raise
         except Exception:
             logger.exception("telegram_start_failed")
             raise
@@ -86,8 +92,7 @@ class TelegramPlatform(Platform):
 
         # Emit event
         if self.engine:
-            event = TelegramMessageEvent()
-            event.context = ctx
+            event = TelegramMessageEvent(context=ctx, timestamp=ctx.timestamp)
             await self.engine.event_bus.emit(event)
 
             # Call platform handler
@@ -99,7 +104,9 @@ class TelegramPlatform(Platform):
 
     def _build_context(self, msg: Any) -> Context:
         """Build context from Telegram message."""
-        user = User(
+        # Context and message share one timestamp object
+        now = now_utc()
+        user = User._fast_new(
             id=str(msg.from_user.id),
             platform_id=f"telegram:{msg.from_user.id}",
             username=msg.from_user.username,
@@ -107,35 +114,37 @@ class TelegramPlatform(Platform):
             is_bot=msg.from_user.is_bot,
         )
 
-        chat = Chat(
+        chat = Chat._fast_new(
             id=str(msg.chat.id),
             platform_id=f"telegram:{msg.chat.id}",
             type=msg.chat.type,
             title=msg.chat.title or msg.chat.full_name,
         )
 
-        message = Message(
+        message = Message._fast_new(
             id=str(msg.message_id),
             content=TextContent(text=msg.text or ""),
             chat_id=str(msg.chat.id),
             sender_id=str(msg.from_user.id),
             platform_data={"telegram_message": msg},
+            timestamp=now,
         )
 
-        return Context(
+        return Context._fast_new(
             message=message,
             user=user,
             chat=chat,
             platform=self,
+            timestamp=now,
         )
 
-    async def send_message(self, message: Message) -> Message | None:
+    async def send_message(self, message: Message) -> MessageRef | None:
         """Send a message to Telegram."""
         if not self._app or not message.chat_id:
             return None
 
         try:
-            text = message.text or str(message.content)
+            text = extract_text(message)
             result = await self._app.bot.send_message(
                 chat_id=int(message.chat_id),
                 text=text,
@@ -143,11 +152,7 @@ class TelegramPlatform(Platform):
                 reply_to_message_id=int(message.reply_to_id) if message.reply_to_id else None,
             )
 
-            return Message(
-                id=str(result.message_id),
-                content=TextContent(text=text),
-                chat_id=message.chat_id,
-            )
+            return MessageRef(str(result.message_id), message.chat_id, text)
         except Exception:
             logger.exception("telegram_send_failed")
             return None
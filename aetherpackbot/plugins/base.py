@@ -4,14 +4,16 @@ from __future__ import annotations
 
 from abc import ABC
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from aetherpackbot.core.events import EventPriority
 
 if TYPE_CHECKING:
     from aetherpackbot.core.context import Context
     from aetherpackbot.core.engine import BotEngine
 
 
-@dataclass
+@dataclass(slots=True)
 class PluginMeta:
     """Plugin metadata."""
 
@@ -24,19 +26,75 @@ class PluginMeta:
 
 
 class Plugin(ABC):
-    """Base plugin class. All plugins should inherit from this."""
+    """Base plugin class. All plugins should inherit from this.
+
+    Per-instance state lives in slots; subclasses that don't declare their
+    own ``__slots__`` still get a ``__dict__`` for their extra attributes.
+    Subclasses overriding ``__init__`` must call ``super().__init__()``.
+    """
+
+    __slots__ = (
+        "engine",
+        "_commands",
+        "_handlers",
+        "_event_handlers",
+        "_event_dispatch",
+        "_alias_index",
+    )
 
     meta: PluginMeta = PluginMeta(name="base")
-    engine: BotEngine | None = None
-
-    _commands: dict[str, Any] = {}
-    _handlers: list[Any] = []
-    _event_handlers: dict[type, list[Any]] = {}
+    engine: BotEngine | None
+
+    # Defining module name -> first Plugin subclass created in it; read by PluginLoader
+    _registry: ClassVar[dict[str, type[Plugin]]] = {}
+    # (attribute name, @command metadata) for each decorated method, collected per class
+    _command_methods: ClassVar[tuple[tuple[str, dict[str, Any]], ...]] = ()
+    # (attribute name, @on_event metadata) for each decorated method, collected per class
+    _event_methods: ClassVar[tuple[tuple[str, dict[str, Any]], ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        Plugin._registry.setdefault(cls.__module__, cls)
+        methods: dict[str, dict[str, Any]] = {}
+        events: dict[str, dict[str, Any]] = {}
+        for klass in reversed(cls.__mro__):
+            for attr, value in vars(klass).items():
+                # An override without the decorator un-registers the command or handler
+                info = getattr(value, "_command_info", None)
+                if info is not None:
+                    methods[attr] = info
+                else:
+                    methods.pop(attr, None)
+                info = getattr(value, "_event_info", None)
+                if info is not None:
+                    events[attr] = info
+                else:
+                    events.pop(attr, None)
+        cls._command_methods = tuple(methods.items())
+        cls._event_methods = tuple(events.items())
 
     def __init__(self) -> None:
-        self._commands = {}
-        self._handlers = []
-        self._event_handlers = {}
+        self.engine = None
+        self._commands: dict[str, Any] = {}
+        self._handlers: list[Any] = []
+        # Event type -> priority -> handlers, plus the flattened dispatch order
+        self._event_handlers: dict[type, dict[int, list[Any]]] = {}
+        self._event_dispatch: dict[type, tuple[Any, ...]] = {}
+        # Command name or alias -> handler, rebuilt on each registration
+        self._alias_index: dict[str, Any] = {}
+
+        # Methods decorated with @command register themselves
+        for attr, info in self._command_methods:
+            self._commands[info["name"]] = {
+                "handler": getattr(self, attr),
+                "description": info["description"],
+                "aliases": info["aliases"],
+            }
+        if self._commands:
+            self._rebuild_alias_index()
+        # ...and so do methods decorated with @on_event
+        for attr, info in self._event_methods:
+            self.register_event_handler(info["event_type"], getattr(self, attr), info["priority"])
 
     async def on_load(self) -> None:
         """Called when plugin is loaded. Override for initialization."""
@@ -63,23 +121,53 @@ class Plugin(ABC):
             "description": description,
             "aliases": aliases or [],
         }
+        self._rebuild_alias_index()
+        if self.engine is not None:
+            self.engine.register_command(name, handler, aliases)
+
+    def _rebuild_alias_index(self) -> None:
+        """Flatten names and aliases into one lookup; names win over aliases."""
+        index: dict[str, Any] = {}
+        for cmd_info in self._commands.values():
+            for alias in cmd_info["aliases"]:
+                index.setdefault(alias, cmd_info["handler"])
+        for cmd_name, cmd_info in self._commands.items():
+            index[cmd_name] = cmd_info["handler"]
+        self._alias_index = index
 
     def get_command(self, name: str) -> Any | None:
-        """Get command handler by name."""
-        if name in self._commands:
-            return self._commands[name]["handler"]
+        """Get command handler by name or alias."""
+        return self._alias_index.get(name)
 
-        # Check aliases
-        for _, cmd_info in self._commands.items():
-            if name in cmd_info.get("aliases", []):
-                return cmd_info["handler"]
-
-        return None
+    def register_event_handler(
+        self,
+        event_type: type,
+        handler: Any,
+        priority: EventPriority = EventPriority.NORMAL,
+    ) -> None:
+        """Register an event handler in its priority bucket."""
+        buckets = self._event_handlers.setdefault(event_type, {})
+        buckets.setdefault(int(priority), []).append(handler)
+        # Flatten once here so dispatch never sorts
+        self._event_dispatch[event_type] = tuple(
+            h for level in sorted(buckets) for h in buckets[level]
+        )
+        if self.engine is not None:
+            self.engine.event_bus.subscribe(event_type, handler, priority)
+
+    def get_event_handlers(self, event_type: type) -> tuple[Any, ...]:
+        """Get handlers for an event type, highest priority first."""
+        return self._event_dispatch.get(event_type, ())
 
     @property
     def commands(self) -> dict[str, Any]:
         """Get all registered commands."""
         return self._commands
 
+    @property
+    def event_handlers(self) -> dict[type, dict[int, list[Any]]]:
+        """Get registered event handlers by event type and priority."""
+        return self._event_handlers
+
     def __repr__(self) -> str:
         return f"<Plugin {self.meta.name} v{self.meta.version}>"
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
 from collections.abc import Callable
 from functools import wraps
 from typing import Any, TypeVar
@@ -29,13 +31,7 @@ def command(
             "aliases": aliases or [],
             "usage": usage,
         }
-
-        @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            return await func(*args, **kwargs)
-
-        wrapper._command_info = func._command_info  # type: ignore
-        return wrapper  # type: ignore
+        return func
 
     return decorator
 
@@ -51,13 +47,7 @@ def handler(
             "pattern": pattern,
             "priority": priority,
         }
-
-        @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            return await func(*args, **kwargs)
-
-        wrapper._handler_info = func._handler_info  # type: ignore
-        return wrapper  # type: ignore
+        return func
 
     return decorator
 
@@ -73,13 +63,7 @@ def on_event(
             "event_type": event_type,
             "priority": priority,
         }
-
-        @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            return await func(*args, **kwargs)
-
-        wrapper._event_info = func._event_info  # type: ignore
-        return wrapper  # type: ignore
+        return func
 
     return decorator
 
@@ -101,19 +85,25 @@ def requires_permission(*permissions: str) -> Callable[[F], F]:
     return decorator
 
 
-def cooldown(seconds: float, per_user: bool = True) -> Callable[[F], F]:
-    """Decorator to add cooldown to a command."""
-    from collections import defaultdict
-    from datetime import datetime, timezone
+def cooldown(
+    seconds: float,
+    per_user: bool = True,
+    max_entries: int = 10_000,
+) -> Callable[[F], F]:
+    """Decorator to add cooldown to a command.
 
-    last_used: dict[str, datetime] = defaultdict(lambda: datetime.min.replace(tzinfo=timezone.utc))
+    Keys are kept in last-use order: entries whose cooldown has lapsed are
+    dropped from the front, and at most ``max_entries`` keys are retained.
+    """
+    # Monotonic timestamps, so wall-clock adjustments can't skip or extend a cooldown
+    last_used: OrderedDict[str, float] = OrderedDict()
 
     def decorator(func: F) -> F:
         @wraps(func)
         async def wrapper(ctx: Any, *args: Any, **kwargs: Any) -> Any:
             key = ctx.user.id if per_user and ctx.user else "global"
-            now = datetime.now(timezone.utc)
-            elapsed = (now - last_used[key]).total_seconds()
+            now = time.monotonic()
+            elapsed = now - last_used.get(key, float("-inf"))
 
             if elapsed < seconds:
                 remaining = seconds - elapsed
@@ -121,6 +111,13 @@ def cooldown(seconds: float, per_user: bool = True) -> Callable[[F], F]:
                 return None
 
             last_used[key] = now
+            last_used.move_to_end(key)
+            # Oldest entries are at the front; stop at the first one still cooling down
+            while last_used:
+                oldest_key, oldest = next(iter(last_used.items()))
+                if now - oldest < seconds and len(last_used) <= max_entries:
+                    break
+                del last_used[oldest_key]
             return await func(ctx, *args, **kwargs)
 
         return wrapper  # type: ignore
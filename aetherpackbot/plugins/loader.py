@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 import importlib.util
+import os
 import sys
+import tempfile
+from importlib.machinery import ModuleSpec
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import orjson
 import structlog
 
 from aetherpackbot.plugins.base import Plugin
@@ -18,78 +23,203 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
+def _default_cache_path() -> Path:
+    """Location of the discovery cache, honouring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aetherpackbot" / "plugins.json"
+
+
 class PluginLoader:
     """Discovers and loads plugins from directories."""
 
-    def __init__(self, engine: BotEngine) -> None:
+    def __init__(self, engine: BotEngine, cache_path: Path | None = None) -> None:
         self.engine = engine
+        # Per-directory scan results keyed by directory mtime; see discover()
+        self.cache_path = cache_path or _default_cache_path()
         self._plugin_dirs: list[Path] = []
         self._loaded: dict[str, Plugin] = {}
+        # Plugin name -> file to load, filled by discover()
+        self._entry_cache: dict[str, Path] = {}
+        # Plugin name -> (spec, source mtime_ns when last executed)
+        self._spec_cache: dict[str, tuple[ModuleSpec, int]] = {}
 
     def add_directory(self, path: str | Path) -> None:
         """Add a directory to search for plugins."""
         path = Path(path)
         if path.exists() and path.is_dir():
             self._plugin_dirs.append(path)
+            self._entry_cache.clear()
             logger.debug("plugin_dir_added", path=str(path))
 
-    def discover(self) -> list[str]:
-        """Discover available plugins. Returns list of plugin names."""
+    def discover(self, force_refresh: bool | None = None) -> list[str]:
+        """Discover available plugins. Returns list of plugin names.
+
+        Scan results are persisted per directory and reused while the
+        directory's mtime is unchanged. That mtime does not move when an
+        ``__init__.py`` is added inside an existing subdirectory; pass
+        ``force_refresh=True`` (or set ``refresh_plugin_cache`` in settings)
+        to rescan regardless.
+        """
+        if force_refresh is None:
+            force_refresh = self.engine.settings.refresh_plugin_cache
+
+        disk_cache = {} if force_refresh else self._read_disk_cache()
+        dirty = force_refresh
         found: list[str] = []
+        entry_cache: dict[str, Path] = {}
 
         for plugin_dir in self._plugin_dirs:
-            for item in plugin_dir.iterdir():
-                if item.is_dir() and (item / "__init__.py").exists():
-                    found.append(item.name)
-                elif item.is_file() and item.suffix == ".py" and item.stem != "__init__":
-                    found.append(item.stem)
+            # Absolute paths keep cached entries valid from any working directory
+            resolved = plugin_dir.resolve()
+            key = str(resolved)
+            mtime_ns = resolved.stat().st_mtime_ns
+            cached = disk_cache.get(key)
+            if cached is not None and cached.get("mtime_ns") == mtime_ns:
+                entries = cached["entries"]
+            else:
+                entries = self._scan_dir(resolved)
+                disk_cache[key] = {"mtime_ns": mtime_ns, "entries": entries}
+                dirty = True
+
+            dir_entries: dict[str, Path] = {}
+            for entry in entries:
+                name = entry["name"]
+                found.append(name)
+                if entry["kind"] == "package":
+                    # A package shadows a same-named module, as in load()
+                    dir_entries[name] = Path(entry["path"])
+                else:
+                    dir_entries.setdefault(name, Path(entry["path"]))
+            # Earlier directories take precedence
+            for name, path in dir_entries.items():
+                entry_cache.setdefault(name, path)
 
+        self._entry_cache = entry_cache
+        if dirty:
+            self._write_disk_cache(disk_cache)
         return found
 
+    @staticmethod
+    def _scan_dir(plugin_dir: Path) -> list[dict[str, str]]:
+        """List the plugin packages and modules directly inside a directory."""
+        entries: list[dict[str, str]] = []
+        # scandir's DirEntry answers is_dir/is_file from the directory read itself
+        with os.scandir(plugin_dir) as it:
+            for entry in it:
+                if entry.is_dir():
+                    init_path = os.path.join(entry.path, "__init__.py")
+                    if os.path.exists(init_path):
+                        entries.append({"name": entry.name, "path": init_path, "kind": "package"})
+                elif entry.is_file() and entry.name.endswith(".py") and entry.name != "__init__.py":
+                    entries.append({"name": entry.name[:-3], "path": entry.path, "kind": "module"})
+        return entries
+
+    def _read_disk_cache(self) -> dict[str, Any]:
+        """Load the persisted discovery cache, treating any problem as a miss."""
+        try:
+            data = orjson.loads(self.cache_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write_disk_cache(self, data: dict[str, Any]) -> None:
+        """Persist the discovery cache atomically; failures only cost the next scan."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps(data))
+                os.replace(tmp, self.cache_path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            logger.debug("plugin_cache_write_failed", path=str(self.cache_path))
+
     def load(self, name: str) -> Plugin | None:
         """Load a plugin by name."""
         if name in self._loaded:
             logger.warning("plugin_already_loaded", name=name)
             return self._loaded[name]
 
+        plugin_class = self._import_plugin(name)
+        if plugin_class is None:
+            return None
+        return self._instantiate(name, plugin_class)
+
+    async def load_all(self, names: list[str]) -> list[Plugin | None]:
+        """Load several plugins, importing their modules concurrently.
+
+        Module execution runs in worker threads so slow top-level imports
+        overlap and stay off the event loop. Instantiation and engine
+        registration happen back on the loop, in the order given.
+        """
+        pending = [name for name in dict.fromkeys(names) if name not in self._loaded]
+        classes = await asyncio.gather(
+            *(asyncio.to_thread(self._import_plugin, name) for name in pending)
+        )
+        for name, plugin_class in zip(pending, classes):
+            if plugin_class is not None:
+                self._instantiate(name, plugin_class)
+        return [self._loaded.get(name) for name in names]
+
+    def _find_path(self, name: str) -> Path | None:
+        """Locate a plugin's file, preferring the discover() cache."""
+        cached = self._entry_cache.get(name)
+        if cached is not None:
+            return cached
+
         for plugin_dir in self._plugin_dirs:
             # Try as package
             package_path = plugin_dir / name / "__init__.py"
             if package_path.exists():
-                return self._load_from_path(name, package_path)
+                return package_path
 
             # Try as module
             module_path = plugin_dir / f"{name}.py"
             if module_path.exists():
-                return self._load_from_path(name, module_path)
+                return module_path
 
-        logger.error("plugin_not_found", name=name)
         return None
 
-    def _load_from_path(self, name: str, path: Path) -> Plugin | None:
-        """Load plugin from file path."""
+    def _import_plugin(self, name: str) -> type[Plugin] | None:
+        """Import a plugin's module and return its Plugin subclass."""
+        path = self._find_path(name)
+        if path is None:
+            logger.error("plugin_not_found", name=name)
+            return None
+
         try:
-            spec = importlib.util.spec_from_file_location(f"aetherpackbot_plugins.{name}", path)
-            if not spec or not spec.loader:
-                return None
+            cached = self._spec_cache.get(name)
+            if cached is not None and cached[0].origin == str(path):
+                spec = cached[0]
+            else:
+                spec = importlib.util.spec_from_file_location(f"aetherpackbot_plugins.{name}", path)
+                if not spec or not spec.loader:
+                    return None
+            self._spec_cache[name] = (spec, os.stat(path).st_mtime_ns)
 
             module = importlib.util.module_from_spec(spec)
             sys.modules[spec.name] = module
+            # Plugin.__init_subclass__ records the class as the module executes
+            Plugin._registry.pop(spec.name, None)
             spec.loader.exec_module(module)
 
-            # Find Plugin subclass
-            plugin_class = None
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if isinstance(attr, type) and issubclass(attr, Plugin) and attr is not Plugin:
-                    plugin_class = attr
-                    break
+            plugin_class = Plugin._registry.get(spec.name)
 
             if not plugin_class:
                 logger.error("no_plugin_class", name=name)
                 return None
+            return plugin_class
+
+        except Exception:
+            logger.exception("plugin_load_failed", name=name)
+            return None
 
-            # Instantiate plugin
+    def _instantiate(self, name: str, plugin_class: type[Plugin]) -> Plugin | None:
+        """Create a plugin instance and register it with the engine."""
+        try:
             plugin = plugin_class()
             plugin.engine = self.engine
             self._loaded[name] = plugin
@@ -104,25 +234,73 @@ class PluginLoader:
             logger.exception("plugin_load_failed", name=name)
             return None
 
-    def unload(self, name: str) -> bool:
-        """Unload a plugin."""
-        if name not in self._loaded:
+    async def unload(self, name: str) -> bool:
+        """Unload a plugin, running its ``on_unload`` hook."""
+        plugin = self._loaded.pop(name, None)
+        if plugin is None:
             return False
 
-        self._loaded.pop(name)
+        self.engine.unregister_plugin(name)
+        await self._shutdown(name, plugin)
 
         # Remove from sys.modules
         module_name = f"aetherpackbot_plugins.{name}"
         if module_name in sys.modules:
             del sys.modules[module_name]
+        Plugin._registry.pop(module_name, None)
 
         logger.info("plugin_unloaded", name=name)
         return True
 
-    def reload(self, name: str) -> Plugin | None:
-        """Reload a plugin."""
-        self.unload(name)
-        return self.load(name)
+    async def reload(self, name: str) -> Plugin | None:
+        """Reload a plugin.
+
+        The old instance's ``on_unload`` runs before the new one is created.
+        If the source file hasn't changed since it was last executed, the
+        already-imported class is re-instantiated without re-executing the
+        module. On a running engine the new instance's ``on_load`` is run too.
+        """
+        plugin_class = self._unchanged_class(name)
+        if plugin_class is not None:
+            old = self._loaded.pop(name, None)
+            self.engine.unregister_plugin(name)
+            if old is not None:
+                await self._shutdown(name, old)
+            logger.debug("plugin_reload_unchanged", name=name)
+            plugin = self._instantiate(name, plugin_class)
+        else:
+            await self.unload(name)
+            plugin = self.load(name)
+
+        if plugin is not None and self.engine.is_running:
+            try:
+                await plugin.on_load()
+            except Exception:
+                logger.exception("plugin_load_failed", name=name)
+        return plugin
+
+    def _unchanged_class(self, name: str) -> type[Plugin] | None:
+        """The imported Plugin class, if its source is unchanged since it was executed."""
+        cached = self._spec_cache.get(name)
+        if cached is None:
+            return None
+        spec, mtime_ns = cached
+        plugin_class = Plugin._registry.get(spec.name)
+        if plugin_class is None or spec.name not in sys.modules:
+            return None
+        try:
+            unchanged = os.stat(spec.origin).st_mtime_ns == mtime_ns
+        except OSError:
+            return None
+        return plugin_class if unchanged else None
+
+    @staticmethod
+    async def _shutdown(name: str, plugin: Plugin) -> None:
+        """Run a plugin's ``on_unload``, logging instead of raising on error."""
+        try:
+            await plugin.on_unload()
+        except Exception:
+            logger.exception("plugin_unload_failed", name=name)
 
     @property
     def plugins(self) -> dict[str, Plugin]:
@@ -1,5 +1,45 @@
 """LLM Providers module - AI model adapters."""
 
-from aetherpackbot.providers.base import ChatMessage, ChatRole, LLMConfig, LLMProvider
+from __future__ import annotations
 
-__all__ = ["LLMProvider", "LLMConfig", "ChatMessage", "ChatRole"]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from aetherpackbot.providers.base import (
+    ChatMessage,
+    ChatRole,
+    LLMConfig,
+    LLMProvider,
+    system_message,
+)
+
+if TYPE_CHECKING:
+    from aetherpackbot.providers.anthropic import AnthropicConfig, AnthropicProvider
+    from aetherpackbot.providers.gemini import GeminiConfig, GeminiProvider
+    from aetherpackbot.providers.openai import OpenAIConfig, OpenAIProvider
+
+# Concrete providers are imported on first access (PEP 562), so deployments
+# only pay for the adapters they actually use
+_LAZY = {
+    "AnthropicConfig": "anthropic",
+    "AnthropicProvider": "anthropic",
+    "GeminiConfig": "gemini",
+    "GeminiProvider": "gemini",
+    "OpenAIConfig": "openai",
+    "OpenAIProvider": "openai",
+}
+
+__all__ = ["LLMProvider", "LLMConfig", "ChatMessage", "ChatRole", "system_message", *_LAZY]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
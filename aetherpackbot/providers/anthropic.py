@@ -18,13 +18,29 @@ from aetherpackbot.providers.base import (
 
 logger = structlog.get_logger(__name__)
 
+# Clients keyed by (api_key, timeout), so providers with the same credentials
+# share one connection pool
+_client_cache: dict[tuple[Any, ...], Any] = {}
 
-@dataclass
+# Anthropic only accepts user/assistant turns; anything else is sent as assistant
+_ANTHROPIC_ROLE = {
+    ChatRole.USER: "user",
+    ChatRole.ASSISTANT: "assistant",
+    ChatRole.TOOL: "assistant",
+}
+
+# Request kwargs that may override the configured defaults
+_ALLOWED = frozenset({"model", "max_tokens"})
+
+
+@dataclass(slots=True)
 class AnthropicConfig(LLMConfig):
     """Anthropic-specific configuration."""
 
     model: str = "claude-3-opus-20240229"
     max_tokens: int = 4096
+    # Mark the system prompt with cache_control when a prompt cache key is given
+    prompt_cache: bool = True
 
 
 class AnthropicProvider(LLMProvider):
@@ -35,37 +51,42 @@ class AnthropicProvider(LLMProvider):
     def __init__(self, config: AnthropicConfig) -> None:
         super().__init__(config)
         self._client = None
+        self._default_params: dict[str, Any] = {
+            "model": config.model,
+            "max_tokens": config.max_tokens,
+        }
 
     def _get_client(self) -> Any:
         """Lazy-load Anthropic client."""
         if self._client is None:
-            try:
-                from anthropic import AsyncAnthropic
-
-                self._client = AsyncAnthropic(
-                    api_key=self.config.api_key,
-                    timeout=self.config.timeout,
-                )
-            except ImportError:
-                logger.error("anthropic_not_installed", hint="pip install anthropic")
-                raise
+            key = (self.config.api_key, self.config.timeout)
+            self._client = _client_cache.get(key)
+            if self._client is None:
+                try:
+                    from anthropic import AsyncAnthropic
+
+                    self._client = _client_cache[key] = AsyncAnthropic(
+                        api_key=self.config.api_key,
+                        timeout=self.config.timeout,
+                    )
+                except ImportError:
+                    logger.error("anthropic_not_installed", hint="pip install anthropic")
+                    raise
         return self._client
 
     def _convert_messages(
         self, messages: list[ChatMessage]
     ) -> tuple[str | None, list[dict[str, Any]]]:
         """Convert ChatMessage to Anthropic format."""
-        system_prompt = None
-        result = []
-
-        for msg in messages:
-            if msg.role == ChatRole.SYSTEM:
-                system_prompt = msg.content
-                continue
-
-            role = "user" if msg.role == ChatRole.USER else "assistant"
-            result.append({"role": role, "content": msg.content})
-
+        # The last system message wins
+        system_prompt = next(
+            (msg.content for msg in reversed(messages) if msg.role == ChatRole.SYSTEM), None
+        )
+        result = [
+            {"role": _ANTHROPIC_ROLE[msg.role], "content": msg.content}
+            for msg in messages
+            if msg.role != ChatRole.SYSTEM
+        ]
         return system_prompt, result
 
     async def chat(
@@ -78,13 +99,13 @@ class AnthropicProvider(LLMProvider):
         system_prompt, converted = self._convert_messages(messages)
 
         params: dict[str, Any] = {
-            "model": kwargs.get("model", self.config.model),
+            **self._default_params,
+            **{k: v for k, v in kwargs.items() if k in _ALLOWED},
             "messages": converted,
-            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
         }
 
         if system_prompt:
-            params["system"] = system_prompt
+            params["system"] = self._system_param(system_prompt, kwargs)
 
         # Add tools if provided
         if tools := kwargs.get("tools"):
@@ -93,13 +114,14 @@ class AnthropicProvider(LLMProvider):
         try:
             response = await client.messages.create(**params)
 
-            content = ""
+            text_parts: list[str] = []
             tool_calls = None
 
             for block in response.content:
-                if block.type == "text":
-                    content += block.text
-                elif block.type == "tool_use":
+                block_type = block.type
+                if block_type == "text":
+                    text_parts.append(block.text)
+                elif block_type == "tool_use":
                     if tool_calls is None:
                         tool_calls = []
                     tool_calls.append(
@@ -111,7 +133,7 @@ class AnthropicProvider(LLMProvider):
                     )
 
             return LLMResponse(
-                content=content,
+                content="".join(text_parts),
                 model=response.model,
                 finish_reason=response.stop_reason,
                 usage={
@@ -137,13 +159,13 @@ class AnthropicProvider(LLMProvider):
         system_prompt, converted = self._convert_messages(messages)
 
         params: dict[str, Any] = {
-            "model": kwargs.get("model", self.config.model),
+            **self._default_params,
+            **{k: v for k, v in kwargs.items() if k in _ALLOWED},
             "messages": converted,
-            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
         }
 
         if system_prompt:
-            params["system"] = system_prompt
+            params["system"] = self._system_param(system_prompt, kwargs)
 
         try:
             async with client.messages.stream(**params) as stream:
@@ -153,6 +175,18 @@ class AnthropicProvider(LLMProvider):
             logger.exception("anthropic_stream_failed")
             raise
 
+    def _system_param(self, system_prompt: str, kwargs: dict[str, Any]) -> Any:
+        """Build the system parameter, marking it cacheable when a prompt cache key is given."""
+        if not (self.config.prompt_cache and kwargs.get("prompt_cache_key")):
+            return system_prompt
+        return [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
     def _convert_tools(self, tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Convert OpenAI-style tools to Anthropic format."""
         result = []
@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 
@@ -18,9 +19,13 @@ class ChatRole(str, Enum):
     TOOL = "tool"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChatMessage:
-    """Chat message for LLM conversation."""
+    """Chat message for LLM conversation.
+
+    Frozen, since instances such as ``system_message`` results are shared
+    between requests.
+    """
 
     role: ChatRole
     content: str
@@ -29,7 +34,17 @@ class ChatMessage:
     tool_call_id: str | None = None
 
 
-@dataclass
+@lru_cache(maxsize=64)
+def system_message(content: str) -> ChatMessage:
+    """Shared system ChatMessage for a prompt.
+
+    System prompts repeat across requests, so one instance per prompt text is
+    reused; ChatMessage is frozen, so no caller can change it for the others.
+    """
+    return ChatMessage(role=ChatRole.SYSTEM, content=content)
+
+
+@dataclass(slots=True)
 class LLMConfig:
     """Base configuration for LLM providers."""
 
@@ -43,7 +58,7 @@ class LLMConfig:
     options: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Response from LLM provider."""
 
@@ -90,8 +105,11 @@ class LLMProvider(ABC):
 
     def count_tokens(self, text: str) -> int:
         """Estimate token count for text. Override for accurate counting."""
-        # Simple estimation: ~4 chars per token
-        return len(text) // 4
+        # Simple estimation: ~4 bytes of UTF-8 per token. str.isascii() is a
+        # flag check, so ASCII text skips the encode entirely
+        if text.isascii():
+            return len(text) >> 2
+        return len(text.encode()) >> 2
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} model={self.config.model}>"
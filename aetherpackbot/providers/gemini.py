@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any
@@ -18,8 +19,15 @@ from aetherpackbot.providers.base import (
 
 logger = structlog.get_logger(__name__)
 
+# Gemini calls the assistant side "model"
+_GEMINI_ROLE = {
+    ChatRole.USER: "user",
+    ChatRole.ASSISTANT: "model",
+    ChatRole.TOOL: "model",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class GeminiConfig(LLMConfig):
     """Gemini-specific configuration."""
 
@@ -31,9 +39,16 @@ class GeminiProvider(LLMProvider):
 
     name = "gemini"
 
+    # Conversations whose converted history is remembered between requests
+    history_cache_size = 64
+
     def __init__(self, config: GeminiConfig) -> None:
         super().__init__(config)
         self._model = None
+        # (role, content) of each message -> converted history, least recently used first
+        self._history_cache: OrderedDict[
+            tuple[tuple[ChatRole, str], ...], tuple[dict[str, Any], ...]
+        ] = OrderedDict()
 
     def _get_model(self) -> Any:
         """Lazy-load Gemini model."""
@@ -50,16 +65,38 @@ class GeminiProvider(LLMProvider):
 
     def _convert_messages(self, messages: list[ChatMessage]) -> list[dict[str, Any]]:
         """Convert ChatMessage to Gemini format."""
-        history = []
-
-        for msg in messages:
-            if msg.role == ChatRole.SYSTEM:
-                # System messages are prepended to the first user message
-                continue
-
-            role = "user" if msg.role == ChatRole.USER else "model"
-            history.append({"role": role, "parts": [msg.content]})
-
+        # System messages are prepended to the first user message
+        return [
+            {"role": _GEMINI_ROLE[msg.role], "parts": [msg.content]}
+            for msg in messages
+            if msg.role != ChatRole.SYSTEM
+        ]
+
+    def _history_for(self, messages: list[ChatMessage]) -> list[dict[str, Any]]:
+        """Convert messages, reusing the conversion of an earlier turn.
+
+        Entries are keyed by every message's role and content, so an edited
+        message or a recycled list is never served stale history. Strings
+        cache their hashes, so building the key is one pass over the
+        messages rather than over their text. A conversation that grows by
+        a turn or two between requests only has the new tail converted.
+        """
+        key = tuple((msg.role, msg.content) for msg in messages)
+        for count in range(len(key), max(len(key) - 3, 0), -1):
+            prefix = key[:count]
+            cached = self._history_cache.get(prefix)
+            if cached is not None:
+                self._history_cache.move_to_end(prefix)
+                history = [*cached, *self._convert_messages(messages[count:])]
+                break
+        else:
+            history = self._convert_messages(messages)
+
+        if messages:
+            self._history_cache[key] = tuple(history)
+            self._history_cache.move_to_end(key)
+            if len(self._history_cache) > self.history_cache_size:
+                self._history_cache.popitem(last=False)
         return history
 
     async def chat(
@@ -69,7 +106,7 @@ class GeminiProvider(LLMProvider):
     ) -> LLMResponse:
         """Send chat completion request."""
         model = self._get_model()
-        history = self._convert_messages(messages)
+        history = self._history_for(messages)
 
         # Extract last user message
         if not history:
@@ -102,7 +139,7 @@ class GeminiProvider(LLMProvider):
     ) -> AsyncIterator[str]:
         """Stream chat completion response."""
         model = self._get_model()
-        history = self._convert_messages(messages)
+        history = self._history_for(messages)
 
         if not history:
             raise ValueError("No messages provided")
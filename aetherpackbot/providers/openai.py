@@ -2,28 +2,59 @@
 
 from __future__ import annotations
 
+import os
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any
+from urllib.parse import urlsplit
 
 import structlog
 
 from aetherpackbot.providers.base import (
     ChatMessage,
+    ChatRole,
     LLMConfig,
     LLMProvider,
     LLMResponse,
 )
 
+try:
+    import tiktoken
+except ImportError:  # token counts fall back to the base estimate
+    tiktoken = None
+
 logger = structlog.get_logger(__name__)
 
+# Clients keyed by (api_key, base_url, timeout), so providers with the same
+# credentials and endpoint share one connection pool
+_client_cache: dict[tuple[Any, ...], Any] = {}
+
+# Request kwargs that may override the configured defaults
+_ALLOWED = frozenset({"model", "max_tokens", "temperature"})
+
+# Encoding for models tiktoken doesn't know by name
+_FALLBACK_ENCODING = "o200k_base"
+
+# Plain role strings, so the per-message conversion skips Enum.value
+_ROLE_STR = {role: role.value for role in ChatRole}
+
 
-@dataclass
+@dataclass(slots=True)
 class OpenAIConfig(LLMConfig):
     """OpenAI-specific configuration."""
 
     model: str = "gpt-4"
     organization: str | None = None
+    # Send prompt_cache_key hints; None sends them only to the official API,
+    # since some OpenAI-compatible servers reject unknown body fields
+    prompt_cache: bool | None = None
+
+
+def _is_official_endpoint(base_url: str | None) -> bool:
+    """Whether requests go to OpenAI itself rather than a compatible server."""
+    # The SDK falls back to OPENAI_BASE_URL when no base_url is configured
+    base_url = base_url or os.environ.get("OPENAI_BASE_URL")
+    return not base_url or urlsplit(base_url).hostname == "api.openai.com"
 
 
 class OpenAIProvider(LLMProvider):
@@ -34,36 +65,58 @@ class OpenAIProvider(LLMProvider):
     def __init__(self, config: OpenAIConfig) -> None:
         super().__init__(config)
         self._client = None
+        self._encoding: Any = None
+        self._prompt_cache = (
+            config.prompt_cache
+            if config.prompt_cache is not None
+            else _is_official_endpoint(config.base_url)
+        )
+        self._default_params: dict[str, Any] = {
+            "model": config.model,
+            "max_tokens": config.max_tokens,
+            "temperature": config.temperature,
+        }
 
     def _get_client(self) -> Any:
         """Lazy-load OpenAI client."""
         if self._client is None:
-            try:
-                from openai import AsyncOpenAI
-
-                self._client = AsyncOpenAI(
-                    api_key=self.config.api_key,
-                    base_url=self.config.base_url,
-                    timeout=self.config.timeout,
-                )
-            except ImportError:
-                logger.error("openai_not_installed", hint="pip install openai")
-                raise
+            key = (self.config.api_key, self.config.base_url, self.config.timeout)
+            self._client = _client_cache.get(key)
+            if self._client is None:
+                try:
+                    from openai import AsyncOpenAI
+
+                    self._client = _client_cache[key] = AsyncOpenAI(
+                        api_key=self.config.api_key,
+                        base_url=self.config.base_url,
+                        timeout=self.config.timeout,
+                    )
+                except ImportError:
+                    logger.error("openai_not_installed", hint="pip install openai")
+                    raise
         return self._client
 
     def _convert_messages(self, messages: list[ChatMessage]) -> list[dict[str, Any]]:
         """Convert ChatMessage to OpenAI format."""
-        result = []
-        for msg in messages:
-            m: dict[str, Any] = {"role": msg.role.value, "content": msg.content}
-            if msg.name:
-                m["name"] = msg.name
-            if msg.tool_calls:
-                m["tool_calls"] = msg.tool_calls
-            if msg.tool_call_id:
-                m["tool_call_id"] = msg.tool_call_id
-            result.append(m)
-        return result
+        # Plain text turns are the common case; only tool/name turns need the slow path
+        return [
+            {"role": _ROLE_STR[msg.role], "content": msg.content}
+            if not (msg.name or msg.tool_calls or msg.tool_call_id)
+            else self._convert_message(msg)
+            for msg in messages
+        ]
+
+    @staticmethod
+    def _convert_message(msg: ChatMessage) -> dict[str, Any]:
+        """Convert one ChatMessage, including its optional name and tool fields."""
+        m: dict[str, Any] = {"role": _ROLE_STR[msg.role], "content": msg.content}
+        if msg.name:
+            m["name"] = msg.name
+        if msg.tool_calls:
+            m["tool_calls"] = msg.tool_calls
+        if msg.tool_call_id:
+            m["tool_call_id"] = msg.tool_call_id
+        return m
 
     async def chat(
         self,
@@ -74,16 +127,19 @@ class OpenAIProvider(LLMProvider):
         client = self._get_client()
 
         params: dict[str, Any] = {
-            "model": kwargs.get("model", self.config.model),
+            **self._default_params,
+            **{k: v for k, v in kwargs.items() if k in _ALLOWED},
             "messages": self._convert_messages(messages),
-            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
-            "temperature": kwargs.get("temperature", self.config.temperature),
         }
 
         # Add tools if provided
         if tools := kwargs.get("tools"):
             params["tools"] = tools
 
+        # Route requests sharing a prompt prefix to the same prompt cache
+        if self._prompt_cache and (cache_key := kwargs.get("prompt_cache_key")):
+            params["extra_body"] = {"prompt_cache_key": cache_key}
+
         try:
             response = await client.chat.completions.create(**params)
             choice = response.choices[0]
@@ -129,13 +185,15 @@ class OpenAIProvider(LLMProvider):
         client = self._get_client()
 
         params: dict[str, Any] = {
-            "model": kwargs.get("model", self.config.model),
+            **self._default_params,
+            **{k: v for k, v in kwargs.items() if k in _ALLOWED},
             "messages": self._convert_messages(messages),
-            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
-            "temperature": kwargs.get("temperature", self.config.temperature),
             "stream": True,
         }
 
+        if self._prompt_cache and (cache_key := kwargs.get("prompt_cache_key")):
+            params["extra_body"] = {"prompt_cache_key": cache_key}
+
         try:
             async for chunk in await client.chat.completions.create(**params):
                 if chunk.choices and chunk.choices[0].delta.content:
@@ -146,10 +204,28 @@ class OpenAIProvider(LLMProvider):
 
     def count_tokens(self, text: str) -> int:
         """Count tokens using tiktoken if available."""
-        try:
-            import tiktoken
-
-            encoding = tiktoken.encoding_for_model(self.config.model)
-            return len(encoding.encode(text))
-        except ImportError:
+        encoding = self._encoding
+        if encoding is None:
+            # Loading the BPE tables is expensive; do it once per provider
+            encoding = self._encoding = self._load_encoding()
+        if encoding is False:
             return super().count_tokens(text)
+        return len(encoding.encode(text))
+
+    def _load_encoding(self) -> Any:
+        """Resolve the model's tiktoken encoding, or False to use the base estimate."""
+        if tiktoken is None:
+            return False
+        try:
+            return tiktoken.encoding_for_model(self.config.model)
+        except KeyError:
+            # Model unknown to tiktoken (custom endpoints, newer models)
+            pass
+        except Exception:
+            logger.warning("tiktoken_load_failed", model=self.config.model, exc_info=True)
+            return False
+        try:
+            return tiktoken.get_encoding(_FALLBACK_ENCODING)
+        except Exception:
+            logger.warning("tiktoken_load_failed", encoding=_FALLBACK_ENCODING, exc_info=True)
+            return False
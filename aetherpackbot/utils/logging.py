@@ -2,27 +2,60 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 import structlog
 
+# Background thread that renders and writes queued records
+_listener: QueueListener | None = None
+
+
+class _EnqueueHandler(QueueHandler):
+    """QueueHandler that passes records through unformatted.
+
+    Rendering happens in the listener thread via ``ProcessorFormatter``, so
+    the caller only pays for building the event dict and a queue put.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+def _capture_exc_info(logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """Resolve ``exc_info=True`` while still on the raising thread."""
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
 
 def setup_logging(
     level: str = "INFO",
     format: str = "json",
     log_file: str | None = None,
 ) -> None:
-    """Configure structured logging."""
-    log_level = getattr(logging, level.upper(), logging.INFO)
+    """Configure structured logging.
 
-    # Configure standard logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=log_level,
-    )
+    Records are queued and written by a background listener thread, keeping
+    JSON rendering and stream I/O off the event loop.
+    """
+    global _listener
+    log_level = getattr(logging, level.upper(), logging.INFO)
 
     # Processors for structlog
     shared_processors: list[Any] = [
@@ -34,28 +67,46 @@ def setup_logging(
 
     if format == "json":
         # JSON format for production
-        processors = [
-            *shared_processors,
+        renderers: list[Any] = [
             structlog.processors.format_exc_info,
             structlog.processors.JSONRenderer(),
         ]
     else:
         # Console format for development
-        processors = [
-            *shared_processors,
-            structlog.dev.ConsoleRenderer(colors=True),
-        ]
+        renderers = [structlog.dev.ConsoleRenderer(colors=True)]
+
+    formatter = structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=shared_processors,
+        processors=[structlog.stdlib.ProcessorFormatter.remove_processors_meta, *renderers],
+    )
+
+    handlers: list[logging.Handler] = [logging.StreamHandler(sys.stdout)]
+    # Add file handler if specified
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        handler.setLevel(log_level)
+
+    _stop_listener()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    root.handlers = [_EnqueueHandler(log_queue)]
+    root.setLevel(log_level)
 
     structlog.configure(
-        processors=processors,
+        processors=[
+            # Drop below-level calls before any processor runs
+            structlog.stdlib.filter_by_level,
+            *shared_processors,
+            _capture_exc_info,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
         wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
-
-    # Add file handler if specified
-    if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(log_level)
-        logging.getLogger().addHandler(file_handler)
@@ -1,9 +1,397 @@
 """Chat plugin for AI-powered conversations."""
 
+import asyncio
+import bisect
+import hashlib
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+import orjson
+import structlog
+
 from aetherpackbot.core.context import Context
 from aetherpackbot.plugins.base import Plugin, PluginMeta
 from aetherpackbot.plugins.decorators import command
-from aetherpackbot.providers.base import ChatMessage, ChatRole
+from aetherpackbot.providers.base import (
+    ChatMessage,
+    ChatRole,
+    LLMProvider,
+    LLMResponse,
+    system_message,
+)
+
+try:
+    import numpy as np
+    from fastembed import TextEmbedding
+except ImportError:  # semantic caching is disabled without the extras
+    np = None
+    TextEmbedding = None
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # /chat_async and the shared response cache need redis
+    aioredis = None
+
+logger = structlog.get_logger(__name__)
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    """Whether a provider SDK error is an HTTP 429.
+
+    OpenAI and Anthropic errors carry ``status_code``; Google API errors ``code``.
+    """
+    return getattr(exc, "status_code", None) == 429 or getattr(exc, "code", None) == 429
+
+
+def _job_message(role: str, content: str) -> ChatMessage:
+    """Rebuild a queued job's message, sharing system messages between jobs."""
+    if role == ChatRole.SYSTEM:
+        return system_message(content)
+    return ChatMessage(role=ChatRole(role), content=content)
+
+
+def _job_owner(ctx: Context) -> str:
+    """Identify who may read a queued job: the submitting user in their chat."""
+    user = ctx.user
+    chat = ctx.chat
+    return orjson.dumps(
+        [
+            user.platform_id if user else None,
+            user.id if user else None,
+            chat.id if chat else None,
+        ]
+    ).decode()
+
+
+def _prefix_cache_key(system_prompt: str) -> str:
+    """Provider prompt-cache key for conversations sharing a system prompt."""
+    return hashlib.blake2b(system_prompt.encode(), digest_size=16).hexdigest()
+
+
+def _resolve(future: asyncio.Future, result: Any) -> None:
+    """Complete a request's future unless it was already cancelled."""
+    if future.done():
+        return
+    if isinstance(result, BaseException):
+        future.set_exception(result)
+    else:
+        future.set_result(result)
+
+
+class SemanticCache:
+    """Response cache matched by cosine similarity of prompt embeddings.
+
+    Embeddings are normalised on insert and kept in one float32 matrix, so a
+    lookup is a single matrix-vector product. Once ``max_entries`` rows are
+    stored, the oldest row is overwritten.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 4096,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+    ) -> None:
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model_name = model_name
+        self._model: Any = None
+        self._matrix: Any = None
+        self._scopes: list[str] = []
+        self._responses: list[str] = []
+        self._next = 0
+
+    def load_model(self) -> None:
+        """Load the embedding model, downloading it on first use. Blocking."""
+        if self._model is None:
+            self._model = TextEmbedding(self.model_name)
+
+    def embed(self, text: str) -> Any:
+        """Embed and normalise one prompt. Blocking; run it off the event loop."""
+        self.load_model()
+        vec = np.asarray(next(iter(self._model.embed([text]))), dtype=np.float32)
+        return vec / (np.linalg.norm(vec) or 1.0)
+
+    def lookup(self, vec: Any, scope: str) -> str | None:
+        """Return the closest cached response in ``scope`` above the threshold."""
+        if not self._responses:
+            return None
+        scores = self._matrix[: len(self._responses)] @ vec
+        for row in np.argsort(scores)[::-1]:
+            if scores[row] < self.threshold:
+                break
+            if self._scopes[row] == scope:
+                return self._responses[row]
+        return None
+
+    def add(self, vec: Any, scope: str, response: str) -> None:
+        """Store a response under its prompt embedding."""
+        if self._matrix is None:
+            self._matrix = np.empty((self.max_entries, vec.shape[0]), dtype=np.float32)
+        row = self._next
+        self._matrix[row] = vec
+        if row == len(self._responses):
+            self._scopes.append(scope)
+            self._responses.append(response)
+        else:
+            self._scopes[row] = scope
+            self._responses[row] = response
+        self._next = (row + 1) % self.max_entries
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._scopes.clear()
+        self._responses.clear()
+        self._next = 0
+
+
+class PendingChat(NamedTuple):
+    """A queued chat request awaiting its batch."""
+
+    provider: LLMProvider
+    messages: list[ChatMessage]
+    kwargs: dict[str, Any]
+    future: asyncio.Future
+
+
+class ChatBatcher:
+    """Coalesces concurrent chat requests into batched provider calls.
+
+    Requests arriving within ``max_wait_ms`` of the first one, up to
+    ``max_batch``, are dispatched together through ``provider.chat_batch``.
+    Providers without ``chat_batch`` gain nothing from waiting, so their
+    requests skip the queue and go straight to ``chat``. Within a batch, requests are split into bins by estimated prompt length
+    so short prompts aren't held back by long ones.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = 32,
+        max_wait_ms: float = 10.0,
+        bin_thresholds: tuple[int, ...] = (64, 256, 1024, 4096),
+    ) -> None:
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        # Upper bounds, in estimated prompt tokens, of each length bin
+        self.bin_thresholds = bin_thresholds
+        self._queue: asyncio.Queue[PendingChat] = asyncio.Queue()
+        # Set once enough requests are queued to fill a batch without waiting
+        self._full = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def submit(
+        self, provider: LLMProvider, messages: list[ChatMessage], **kwargs: Any
+    ) -> LLMResponse:
+        """Queue a request and wait for its response."""
+        if getattr(provider, "chat_batch", None) is None:
+            return await provider.chat(messages, **kwargs)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        future: asyncio.Future[LLMResponse] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(PendingChat(provider, messages, kwargs, future))
+        if self._queue.qsize() >= self.max_batch - 1:
+            self._full.set()
+        return await future
+
+    async def stop(self) -> None:
+        """Stop collecting and fail any requests still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while not self._queue.empty():
+            future = self._queue.get_nowait().future
+            if not future.done():
+                future.set_exception(RuntimeError("chat batcher stopped"))
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            if self._queue.qsize() < self.max_batch - 1:
+                self._full.clear()
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.max_wait)
+                except asyncio.TimeoutError:
+                    pass
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            # Dispatch in the background so the next batch can start collecting
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: list[PendingChat]) -> None:
+        # One provider call per (provider, length bin, request options) combination
+        groups: dict[tuple[Any, ...], list[PendingChat]] = {}
+        for item in batch:
+            # Requests that timed out or were cancelled while queued are dropped
+            if item.future.done():
+                continue
+            # ~4 characters per token; only the latest turn varies between requests
+            estimate = len(item.messages[-1].content) >> 2
+            length_bin = bisect.bisect_left(self.bin_thresholds, estimate)
+            key = (id(item.provider), length_bin, *sorted(item.kwargs.items()))
+            groups.setdefault(key, []).append(item)
+        await asyncio.gather(*(self._dispatch_group(group) for group in groups.values()))
+
+    async def _dispatch_group(self, group: list[PendingChat]) -> None:
+        provider, kwargs = group[0].provider, group[0].kwargs
+        try:
+            results: list[Any] = list(
+                await provider.chat_batch([item.messages for item in group], **kwargs)
+            )
+        except Exception as e:
+            results = [e] * len(group)
+        for item, result in zip(group, results):
+            _resolve(item.future, result)
+
+
+class RedisCacheBackend:
+    """Response cache shared between bot processes through Redis.
+
+    Values are stored as bytes and expire after ``ttl`` seconds.
+    """
+
+    prefix = "aetherpackbot:chat:cache"
+
+    def __init__(self, client: Any, ttl: int = 3600) -> None:
+        self.client = client
+        self.ttl = ttl
+
+    async def get(self, key: str) -> bytes | None:
+        """Get a cached value."""
+        return await self.client.get(f"{self.prefix}:{key}")
+
+    async def set(self, key: str, value: bytes, ex: int | None = None) -> None:
+        """Store a value, expiring after ``ex`` seconds (default ``ttl``)."""
+        await self.client.set(f"{self.prefix}:{key}", value, ex=ex or self.ttl)
+
+
+class AsyncChatQueue:
+    """Redis-backed queue for chat requests answered out of band.
+
+    Job IDs sit in a sorted set scored by submit time, with payloads and
+    results under plain keys. A job's payload is deleted only once its
+    result is stored, so a job is pending for as long as the payload exists.
+    Payloads and results carry the submitter's owner string, and lookups
+    under any other owner see nothing. Popped jobs that never get a result
+    (Redis errors, shutdown) go back on the queue; if ``handle`` itself
+    fails they are answered with ``error_result``.
+    """
+
+    prefix = "aetherpackbot:chat"
+
+    def __init__(
+        self,
+        client: Any,
+        batch_size: int = 32,
+        poll_interval: float = 1.0,
+        result_ttl: int = 86400,
+        error_result: str = "Error contacting model",
+    ) -> None:
+        self.client = client
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.result_ttl = result_ttl
+        self.error_result = error_result
+        self._queue_key = f"{self.prefix}:queue"
+
+    async def submit(self, messages: list[ChatMessage], owner: str) -> str:
+        """Queue a conversation for ``owner`` and return its job ID."""
+        # Unguessable, since knowing an ID is what lets a caller ask for the job
+        job_id = secrets.token_urlsafe(16)
+        payload = orjson.dumps([owner, [[m.role.value, m.content] for m in messages]])
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(f"{self.prefix}:job:{job_id}", payload)
+            pipe.zadd(self._queue_key, {job_id: time.time()})
+            await pipe.execute()
+        return job_id
+
+    async def result(self, job_id: str, owner: str) -> str | None:
+        """Get a finished job's response, if ``owner`` submitted it."""
+        value = await self.client.get(f"{self.prefix}:result:{job_id}")
+        if value is None:
+            return None
+        job_owner, text = orjson.loads(value)
+        return text if job_owner == owner else None
+
+    async def is_pending(self, job_id: str, owner: str) -> bool:
+        """Whether ``owner``'s job is queued or being answered."""
+        value = await self.client.get(f"{self.prefix}:job:{job_id}")
+        return value is not None and orjson.loads(value)[0] == owner
+
+    async def run(
+        self, handle: Callable[[list[list[ChatMessage]]], Awaitable[list[str]]]
+    ) -> None:
+        """Drain the queue in batches until cancelled."""
+        while True:
+            popped = None
+            try:
+                popped = await self.client.zpopmin(self._queue_key, self.batch_size)
+                if not popped:
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+                job_ids = [m.decode() if isinstance(m, bytes) else m for m, _ in popped]
+                await self._process(job_ids, handle)
+            except asyncio.CancelledError:
+                if popped:
+                    await self._requeue(popped)
+                raise
+            except Exception:
+                logger.exception("chat_queue_failed")
+                if popped:
+                    await self._requeue(popped)
+                await asyncio.sleep(self.poll_interval)
+
+    async def _requeue(self, popped: list[tuple[Any, float]]) -> None:
+        """Put popped jobs back at their original place in the queue.
+
+        Jobs that already have a result are skipped by ``_process`` once
+        their payload is gone, so requeueing a whole batch is safe.
+        """
+        try:
+            await self.client.zadd(self._queue_key, dict(popped))
+        except Exception:
+            logger.exception("chat_queue_requeue_failed", jobs=len(popped))
+
+    async def _process(
+        self,
+        job_ids: list[str],
+        handle: Callable[[list[list[ChatMessage]]], Awaitable[list[str]]],
+    ) -> None:
+        payloads = await self.client.mget([f"{self.prefix}:job:{j}" for j in job_ids])
+        jobs = []
+        for job_id, payload in zip(job_ids, payloads):
+            if payload is None:
+                continue
+            owner, turns = orjson.loads(payload)
+            jobs.append((job_id, owner, [_job_message(role, content) for role, content in turns]))
+        if not jobs:
+            return
+        try:
+            results = await handle([messages for _, _, messages in jobs])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Retrying would likely fail the same way; answer so nobody waits forever
+            logger.exception("chat_queue_handle_failed", jobs=len(jobs))
+            results = [self.error_result] * len(jobs)
+        async with self.client.pipeline(transaction=True) as pipe:
+            for (job_id, owner, _), text in zip(jobs, results):
+                pipe.set(
+                    f"{self.prefix}:result:{job_id}",
+                    orjson.dumps([owner, text]),
+                    ex=self.result_ttl,
+                )
+                pipe.delete(f"{self.prefix}:job:{job_id}")
+            await pipe.execute()
 
 
 class ChatPlugin(Plugin):
@@ -16,19 +404,114 @@ class ChatPlugin(Plugin):
         author="AetherPackBot Team",
     )
 
+    # Exact-match response cache size
+    cache_size = 1024
+    # Minimum cosine similarity for a semantic cache hit
+    semantic_threshold = 0.92
+    # Prompts longer than this are rejected before reaching the provider
+    max_input_tokens = 4096
+    # Cap on reply length, passed to the provider as max_tokens
+    max_output_tokens = 1024
+    # Rate-limited requests are retried with exponential backoff
+    max_retries = 3
+    retry_base_delay = 1.0
+    error_reply = "Error contacting model"
+    timeout_reply = "Model timed out"
+    # Seconds to wait for a reply; None uses the provider's configured timeout
+    request_timeout: float | None = None
+
     def __init__(self) -> None:
         super().__init__()
-        self.system_prompt = "You are a helpful assistant."
+        self._set_system_prompt("You are a helpful assistant.")
+        # Cache key -> response text, in least-recently-used order
+        self._response_cache: OrderedDict[str, str] = OrderedDict()
+        # Paraphrase matching; enabled in on_load by the semantic_cache setting
+        self._semantic: SemanticCache | None = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._batcher = ChatBatcher()
+        self._retries: set[asyncio.Task] = set()
+        # Set up in on_load when a Redis URL is configured
+        self._redis: Any = None
+        self._shared_cache: RedisCacheBackend | None = None
+        self._jobs: AsyncChatQueue | None = None
+        self._jobs_worker: asyncio.Task | None = None
+
+    def _set_system_prompt(self, prompt: str) -> None:
+        """Set the system prompt and rebuild everything derived from it."""
+        self.system_prompt = prompt
+        self._system_msg = system_message(prompt)
+        self._messages_prefix = (self._system_msg,)
+        self._prefix_key = _prefix_cache_key(prompt)
+
+    def _cache_key(self, user_message: str, provider: LLMProvider) -> str:
+        """Key a response by system prompt, user message and provider."""
+        payload = orjson.dumps(
+            {"s": self.system_prompt, "u": user_message, "p": provider.config.name},
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
     async def on_load(self) -> None:
-        """Register commands."""
-        self.register_command("chat", self.chat_command)
-        self.register_command("ask", self.chat_command, aliases=["ai"])
+        """Set up the optional semantic cache, shared cache and job worker."""
+        provider = self.engine.get_default_provider() if self.engine else None
+        if provider is not None:
+            # Tokenizers can be slow to load (or download); warm it off the event loop
+            try:
+                await asyncio.to_thread(provider.count_tokens, "")
+            except Exception:
+                logger.warning("tokenizer_warmup_failed", provider=provider.config.name, exc_info=True)
 
-    @command(name="chat", description="Chat with AI")
+        if self.engine and self.engine.settings.semantic_cache:
+            await self._load_semantic_cache()
+
+        redis_url = self.engine.settings.redis_url if self.engine else None
+        if redis_url and aioredis is None:
+            logger.warning(
+                "redis_unavailable",
+                disabled=["shared_cache", "chat_async"],
+                hint="pip install aetherpackbot[redis]",
+            )
+        elif redis_url:
+            self._redis = aioredis.from_url(redis_url)
+            self._shared_cache = RedisCacheBackend(self._redis)
+            self._jobs = AsyncChatQueue(self._redis, error_result=self.error_reply)
+            self._jobs_worker = asyncio.create_task(self._jobs.run(self._answer_jobs))
+
+    async def _load_semantic_cache(self) -> None:
+        """Create the semantic cache and load its model off the event loop."""
+        if TextEmbedding is None:
+            logger.warning("semantic_cache_unavailable", hint="pip install aetherpackbot[semantic]")
+            return
+        cache = SemanticCache(self.semantic_threshold)
+        try:
+            await asyncio.to_thread(cache.load_model)
+        except Exception:
+            logger.exception("semantic_cache_load_failed", model=cache.model_name)
+            return
+        self._semantic = cache
+
+    async def on_unload(self) -> None:
+        """Stop background work: retries, the job worker and the batcher."""
+        for task in self._retries:
+            task.cancel()
+        if self._jobs_worker is not None:
+            self._jobs_worker.cancel()
+            try:
+                await self._jobs_worker
+            except asyncio.CancelledError:
+                pass
+            self._jobs_worker = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = self._shared_cache = self._jobs = None
+        await self._batcher.stop()
+
+    @command(name="chat", description="Chat with AI", aliases=["ask", "ai"])
     async def chat_command(self, ctx: Context) -> None:
         """Handle chat command."""
-        if not ctx.args:
+        user_message = ctx.raw_args
+        if not user_message:
             await ctx.reply("Usage: /chat <your message>")
             return
 
@@ -41,38 +524,207 @@ class ChatPlugin(Plugin):
             await ctx.reply("No LLM provider configured")
             return
 
-        # Send typing indicator
-        await ctx.reply_typing()
-
         # Build messages
-        user_message = " ".join(ctx.args)
-        messages = [
-            ChatMessage(role=ChatRole.SYSTEM, content=self.system_prompt),
-            ChatMessage(role=ChatRole.USER, content=user_message),
-        ]
+        key = self._cache_key(user_message, provider)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            self._response_cache.move_to_end(key)
+            await ctx.reply(cached)
+            return
+
+        if self._shared_cache is not None:
+            cached = await self._shared_get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                self._remember(key, cached)
+                await ctx.reply(cached)
+                return
+
+        # Checked after the exact-match caches, before spending an embedding on it
+        if provider.count_tokens(user_message) > self.max_input_tokens:
+            await ctx.reply("Message too long")
+            return
+
+        vec = None
+        if self._semantic is not None:
+            vec = await asyncio.to_thread(self._semantic.embed, user_message)
+            cached = self._semantic.lookup(vec, provider.config.name)
+            if cached is not None:
+                self.cache_hits += 1
+                await ctx.reply(cached)
+                return
+        self.cache_misses += 1
+
+        messages = [*self._messages_prefix, ChatMessage(role=ChatRole.USER, content=user_message)]
 
+        # Only show typing once a provider call is actually needed
+        await ctx.reply_typing()
+        await self._ask(ctx, provider, messages, key, vec)
+
+    async def _ask(
+        self,
+        ctx: Context,
+        provider: LLMProvider,
+        messages: list[ChatMessage],
+        key: str,
+        vec: Any,
+        attempt: int = 0,
+    ) -> None:
+        """Send a request to the provider, cache the response and reply."""
         try:
-            response = await provider.chat(messages)
-            await ctx.reply(response.content)
+            response = await self._submit(provider, messages, self._prefix_key)
+        except asyncio.TimeoutError:
+            logger.warning("chat_request_timeout", provider=provider.config.name)
+            await ctx.reply(self.timeout_reply)
+            return
         except Exception as e:
-            await ctx.reply(f"Error: {str(e)}")
+            if _is_rate_limited(e) and attempt < self.max_retries:
+                delay = self.retry_base_delay * 2**attempt
+                logger.warning("chat_rate_limited", attempt=attempt + 1, retry_in=delay)
+                task = asyncio.create_task(
+                    self._retry_after(delay, ctx, provider, messages, key, vec, attempt + 1)
+                )
+                self._retries.add(task)
+                task.add_done_callback(self._retries.discard)
+                return
+            logger.exception("chat_request_failed", provider=provider.config.name)
+            await ctx.reply(self.error_reply)
+            return
+
+        self._remember(key, response.content)
+        if vec is not None:
+            self._semantic.add(vec, provider.config.name, response.content)
+        await ctx.reply(response.content)
+        if self._shared_cache is not None:
+            await self._shared_set(key, response.content)
+
+    def _remember(self, key: str, content: str) -> None:
+        """Add a response to the in-process LRU."""
+        self._response_cache[key] = content
+        if len(self._response_cache) > self.cache_size:
+            self._response_cache.popitem(last=False)
+
+    async def _shared_get(self, key: str) -> str | None:
+        """Look up the shared cache; Redis errors and unreadable entries count as a miss."""
+        try:
+            value = await self._shared_cache.get(key)
+            if value is None:
+                return None
+            content = orjson.loads(value)
+        except Exception:
+            logger.warning("chat_cache_get_failed", exc_info=True)
+            return None
+        return content if isinstance(content, str) else None
+
+    async def _shared_set(self, key: str, content: str) -> None:
+        """Store a response in the shared cache; failures are only logged."""
+        try:
+            await self._shared_cache.set(key, orjson.dumps(content))
+        except Exception:
+            logger.warning("chat_cache_set_failed", exc_info=True)
+
+    async def _submit(
+        self, provider: LLMProvider, messages: list[ChatMessage], prefix_key: str
+    ) -> LLMResponse:
+        """Send one request through the batcher, bounded by the request timeout."""
+        timeout = self.request_timeout or provider.config.timeout
+        return await asyncio.wait_for(
+            self._batcher.submit(
+                provider,
+                messages,
+                max_tokens=self.max_output_tokens,
+                prompt_cache_key=prefix_key,
+            ),
+            timeout,
+        )
+
+    async def _retry_after(self, delay: float, *args: Any) -> None:
+        await asyncio.sleep(delay)
+        await self._ask(*args)
+
+    @command(name="chat_async", description="Queue a chat request and get a job ID")
+    async def chat_async_command(self, ctx: Context) -> None:
+        """Queue a chat request to be answered in the background."""
+        user_message = ctx.raw_args
+        if not user_message:
+            await ctx.reply("Usage: /chat_async <your message>")
+            return
+
+        if self._jobs is None:
+            await ctx.reply(self._jobs_unavailable_reply())
+            return
+
+        provider = self.engine.get_default_provider() if self.engine else None
+        if provider and provider.count_tokens(user_message) > self.max_input_tokens:
+            await ctx.reply("Message too long")
+            return
+
+        messages = [*self._messages_prefix, ChatMessage(role=ChatRole.USER, content=user_message)]
+        job_id = await self._jobs.submit(messages, _job_owner(ctx))
+        await ctx.reply(f"Queued as job {job_id}. Use /chat_result {job_id} to fetch the answer.")
+
+    @command(name="chat_result", description="Fetch the answer to a queued chat request")
+    async def chat_result_command(self, ctx: Context) -> None:
+        """Reply with a queued request's answer, if it's ready."""
+        job_id = ctx.raw_args
+        if not job_id:
+            await ctx.reply("Usage: /chat_result <job id>")
+            return
+
+        if self._jobs is None:
+            await ctx.reply(self._jobs_unavailable_reply())
+            return
+
+        owner = _job_owner(ctx)
+        result = await self._jobs.result(job_id, owner)
+        if result is not None:
+            await ctx.reply(result)
+        elif await self._jobs.is_pending(job_id, owner):
+            await ctx.reply(f"Job {job_id} is still pending")
+        else:
+            await ctx.reply(f"Unknown job {job_id}")
+
+    def _jobs_unavailable_reply(self) -> str:
+        """Explain why the job queue isn't running."""
+        if aioredis is None and self.engine and self.engine.settings.redis_url:
+            return "Async chat is unavailable: the redis package is not installed"
+        return "Async chat is not configured"
+
+    async def _answer_jobs(self, batch: list[list[ChatMessage]]) -> list[str]:
+        """Answer a batch of queued conversations through the batcher."""
+        provider = self.engine.get_default_provider() if self.engine else None
+        if provider is None:
+            return ["No LLM provider configured"] * len(batch)
+        responses = await asyncio.gather(
+            *(
+                self._submit(provider, messages, _prefix_cache_key(messages[0].content))
+                for messages in batch
+            ),
+            return_exceptions=True,
+        )
+        results = []
+        for response in responses:
+            if isinstance(response, asyncio.TimeoutError):
+                logger.warning("chat_job_timeout", provider=provider.config.name)
+                results.append(self.timeout_reply)
+            elif isinstance(response, BaseException):
+                logger.error("chat_job_failed", provider=provider.config.name, exc_info=response)
+                results.append(self.error_reply)
+            else:
+                results.append(response.content)
+        return results
 
     @command(name="setprompt", description="Set system prompt")
     async def set_prompt_command(self, ctx: Context) -> None:
         """Set the system prompt."""
-        if not ctx.args:
+        prompt = ctx.raw_args
+        if not prompt:
             await ctx.reply(f"Current prompt: {self.system_prompt}")
             return
 
-        self.system_prompt = " ".join(ctx.args)
+        self._set_system_prompt(prompt)
+        self._response_cache.clear()
+        if self._semantic is not None:
+            self._semantic.clear()
         await ctx.reply("System prompt updated!")
-
-    async def on_message(self, context: Context) -> bool:
-        """Handle messages."""
-        if context.is_command:
-            cmd = context.command
-            handler = self.get_command(cmd)
-            if handler:
-                await handler(context)
-                return True
-        return False
@@ -15,20 +15,11 @@ class EchoPlugin(Plugin):
         author="AetherPackBot Team",
     )
 
-    async def on_load(self) -> None:
-        """Called when plugin is loaded."""
-        self.register_command(
-            "echo",
-            self.echo_command,
-            description="Echo a message back",
-            aliases=["say"],
-        )
-
-    @command(name="echo", description="Echo your message back")
+    @command(name="echo", description="Echo your message back", aliases=["say"])
     async def echo_command(self, ctx: Context) -> None:
         """Echo the user's message."""
-        if ctx.args:
-            message = " ".join(ctx.args)
+        message = ctx.raw_args
+        if message:
             await ctx.reply(f"🔊 {message}")
         else:
             await ctx.reply("Usage: /echo <message>")
@@ -37,14 +28,3 @@ class EchoPlugin(Plugin):
     async def ping_command(self, ctx: Context) -> None:
         """Respond with pong."""
         await ctx.reply("🏓 Pong!")
-
-    async def on_message(self, context: Context) -> bool:
-        """Handle general messages."""
-        # Check for commands
-        if context.is_command:
-            cmd = context.command
-            handler = self.get_command(cmd)
-            if handler:
-                await handler(context)
-                return True
-        return False